@@ -44,10 +44,73 @@ parameters:
 import re
 import time
 import enum
+import struct
 from collections.abc import Sequence
+from functools import lru_cache
 
 from . import uint
 
+# Pre-compiled structures for fixed-width fields.  The 16-bit control field
+# is sent little-endian; the XID group length is big-endian.
+_U8 = struct.Struct("B")
+_U16LE = struct.Struct("<H")
+
+# FRMR control byte followed by its information field: W/X/Y/Z,
+# V(R)/CR/V(S) and the rejected control field
+_FRMR_PAYLOAD = struct.Struct("BBBB")
+
+# A single address, and the destination and source addresses at the start
+# of the frame header
+_ADDRESS = struct.Struct("7s")
+_ADDRESS_PAIR = struct.Struct("7s7s")
+
+# XID information field header: FI, GI and the (big-endian) GL
+_XID_HDR = struct.Struct(">BBH")
+
+# XID parameter header: PI and PL
+_XID_PARAM_HDR = struct.Struct("BB")
+
+# Call-sign characters in the address field are shifted left by one bit.
+_CALL_ENCODE = bytes((c << 1) & 0xFF for c in range(256))
+_CALL_DECODE = bytes(c >> 1 for c in range(256))
+
+
+@lru_cache(maxsize=256)
+def _encode_callsign(callsign):
+    """
+    Encode the call-sign portion of an AX.25 address.  The same handful of
+    call-signs tend to appear over and over, so the result is cached.
+    """
+    # Call-sign characters are shifted left one bit
+    return callsign[0:6].ljust(6).encode("US-ASCII").translate(_CALL_ENCODE)
+
+
+@lru_cache(maxsize=256)
+def _decode_address(address):
+    """
+    Decode the fields of a 7-byte AX.25 address: call-sign, SSID, C/H bit,
+    reserved bits and extension bit.  As with encoding, the result is cached
+    since the same addresses keep turning up.
+    """
+    # Call-sign characters are shifted right one bit
+    callsign = address[0:6].translate(_CALL_DECODE).decode("US-ASCII").strip()
+    ssid = (address[6] & 0b00011110) >> 1
+    ch = bool(address[6] & 0b10000000)
+    res1 = bool(address[6] & 0b01000000)
+    res0 = bool(address[6] & 0b00100000)
+    extension = bool(address[6] & 0b00000001)
+    return (callsign, ssid, ch, res0, res1, extension)
+
+
+# Decoded FRMR information field bytes: (W, X, Y, Z) and (V(R), CR, V(S))
+_FRMR_WXYZ = tuple(
+    (bool(b & 0x01), bool(b & 0x02), bool(b & 0x04), bool(b & 0x08))
+    for b in range(256)
+)
+_FRMR_VRCRVS = tuple(
+    ((b & 0xE0) >> 5, bool(b & 0x10), (b & 0x0E) >> 1) for b in range(256)
+)
+
 # Frame type classes
 
 
@@ -56,6 +119,21 @@ class AX25Frame(object):
     Base class for AX.25 frames.
     """
 
+    __slots__ = (
+        "_header",
+        "_timestamp",
+        "_deadline",
+        "_encoded_payload",
+        # Control field state.  The I and S-frame mixins set these, but
+        # cannot declare slots of their own alongside those above.
+        "_nr",
+        "_ns",
+        "_pf",
+        "_code",
+        "_pid",
+        "_payload",
+    )
+
     # fmt: off
     # The following are the same for 8 and 16-bit control fields.
     CONTROL_I_MASK  = 0b00000001
@@ -89,10 +167,11 @@ class AX25Frame(object):
         if isinstance(data, AX25Frame):
             # We were given a previously decoded frame.
             header = data.header
-            data = data.frame_payload
+            data = memoryview(data.frame_payload)
         else:
-            # We were given raw data.
-            (header, data) = AX25FrameHeader.decode(bytes(data))
+            # We were given raw data.  Wrap it in a memoryview so that
+            # slicing off the header and control fields does not copy.
+            (header, data) = AX25FrameHeader.decode(memoryview(data))
 
         if not data:
             raise ValueError("Insufficient packet data")
@@ -115,7 +194,7 @@ class AX25Frame(object):
                 # decode the rest of it!
                 if len(data) < 2:
                     raise ValueError("Insufficient packet data")
-                control |= data[1] << 8
+                (control,) = _U16LE.unpack_from(data)
 
                 # Discard the control field from the data payload as we
                 # have decoded it now.
@@ -140,7 +219,7 @@ class AX25Frame(object):
                     repeaters=header.repeaters,
                     cr=header.cr,
                     src_cr=header.src_cr,
-                    payload=data,
+                    payload=bytes(data),
                 )
 
             # We've got the full control field and payload now.
@@ -172,24 +251,18 @@ class AX25Frame(object):
         )
         self._timestamp = timestamp or time.time()
         self._deadline = deadline
-
-    def _encode(self):
-        """
-        Generate the encoded AX.25 frame.
-        """
-        # Send the addressing header
-        for byte in bytes(self.header):
-            yield byte
-
-        # Send the payload
-        for byte in self.frame_payload:
-            yield byte
+        self._encoded_payload = None
 
     def __bytes__(self):
         """
         Encode the AX.25 frame
         """
-        return bytes(self._encode())
+        # The payload does not change once constructed, so it is only
+        # generated once.  The header is encoded each time, since the
+        # addresses in it (e.g. the H bits of repeaters) may be modified.
+        if self._encoded_payload is None:
+            self._encoded_payload = self.frame_payload
+        return b"".join((bytes(self.header), self._encoded_payload))
 
     def __str__(self):
         return "%s %s:\nPayload=%r" % (
@@ -243,6 +316,9 @@ class AX25Frame(object):
         clone = self._copy()
         if header is not None:
             clone._header = header
+
+        # Same payload, so its encoded form can be shared.
+        clone._encoded_payload = self._encoded_payload
         return clone
 
 
@@ -251,6 +327,8 @@ class AX258BitFrame(AX25Frame):
     Base class for AX.25 frames which have a 8-bit control field.
     """
 
+    __slots__ = ()
+
     POLL_FINAL = 0b00010000
 
     # Control field bits
@@ -302,7 +380,7 @@ class AX258BitFrame(AX25Frame):
         """
         Return the bytes in the frame payload (including the control byte)
         """
-        return bytes([self.control])
+        return _U8.pack(self.control)
 
 
 class AX2516BitFrame(AX25Frame):
@@ -310,6 +388,8 @@ class AX2516BitFrame(AX25Frame):
     Base class for AX.25 frames which have a 16-bit control field.
     """
 
+    __slots__ = ()
+
     POLL_FINAL = 0b0000000100000000
 
     # Control field bits.  These are sent least-significant bit first.
@@ -364,7 +444,7 @@ class AX2516BitFrame(AX25Frame):
         """
         # The control field is sent in LITTLE ENDIAN format so as to avoid
         # S frames possibly getting confused with U frames.
-        return uint.encode(self.control, big_endian=False, length=2)
+        return _U16LE.pack(self.control)
 
 
 class AX25RawFrame(AX25Frame):
@@ -379,6 +459,8 @@ class AX25RawFrame(AX25Frame):
     the frame can be used as-is.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         destination,
@@ -425,10 +507,16 @@ class AX25UnnumberedFrame(AX258BitFrame):
     All U frames have an 8-bit control field.
     """
 
+    __slots__ = ("_modifier",)
+
     MODIFIER_MASK = 0b11101111
 
     SUBCLASSES = {}
 
+    # Decoder look-up table indexed by the raw control byte, so that the
+    # P/F bit need not be masked off before looking up the sub-class.
+    DECODERS = [None] * 256
+
     @classmethod
     def register(cls, subclass):
         """
@@ -438,6 +526,8 @@ class AX25UnnumberedFrame(AX258BitFrame):
             subclass.MODIFIER not in cls.SUBCLASSES
         ), "Duplicate registration"
         cls.SUBCLASSES[subclass.MODIFIER] = subclass
+        cls.DECODERS[subclass.MODIFIER] = subclass
+        cls.DECODERS[subclass.MODIFIER | cls.POLL_FINAL] = subclass
 
     @classmethod
     def decode(cls, header, control, data):
@@ -449,8 +539,7 @@ class AX25UnnumberedFrame(AX258BitFrame):
         """
 
         # Decode based on the control field
-        modifier = control & cls.MODIFIER_MASK
-        subclass = cls.SUBCLASSES.get(modifier, None)
+        subclass = cls.DECODERS[control]
         if subclass is not None:
             return subclass.decode(header, control, data)
 
@@ -467,7 +556,7 @@ class AX25UnnumberedFrame(AX258BitFrame):
             repeaters=header.repeaters,
             cr=header.cr,
             src_cr=header.src_cr,
-            modifier=modifier,
+            modifier=control & cls.MODIFIER_MASK,
             pf=bool(control & cls.POLL_FINAL),
         )
 
@@ -545,6 +634,8 @@ class AX25InformationFrameMixin(object):
     Common code for AX.25 all information frames
     """
 
+    __slots__ = ()
+
     @classmethod
     def decode(cls, header, control, data):
         return cls(
@@ -552,8 +643,8 @@ class AX25InformationFrameMixin(object):
             source=header.source,
             repeaters=header.repeaters,
             cr=header.cr,
-            nr=int((control & cls.CONTROL_NR_MASK) >> cls.CONTROL_NR_SHIFT),
-            ns=int((control & cls.CONTROL_NS_MASK) >> cls.CONTROL_NS_SHIFT),
+            nr=(control & cls.CONTROL_NR_MASK) >> cls.CONTROL_NR_SHIFT,
+            ns=(control & cls.CONTROL_NS_MASK) >> cls.CONTROL_NS_SHIFT,
             pf=bool(control & cls.POLL_FINAL),
             pid=data[0],
             payload=data[1:],
@@ -618,10 +709,12 @@ class AX25InformationFrameMixin(object):
 
     @property
     def frame_payload(self):
-        return (
-            super(AX25InformationFrameMixin, self).frame_payload
-            + bytearray([self.pid])
-            + self.payload
+        return b"".join(
+            (
+                super(AX25InformationFrameMixin, self).frame_payload,
+                bytes((self.pid,)),
+                self.payload,
+            )
         )
 
     @property
@@ -666,7 +759,7 @@ class AX258BitInformationFrame(AX25InformationFrameMixin, AX258BitFrame):
     A representation of an information frame using modulo-8 acknowledgements.
     """
 
-    pass
+    __slots__ = ()
 
 
 class AX2516BitInformationFrame(AX25InformationFrameMixin, AX2516BitFrame):
@@ -674,7 +767,7 @@ class AX2516BitInformationFrame(AX25InformationFrameMixin, AX2516BitFrame):
     A representation of an information frame using modulo-128 acknowledgements.
     """
 
-    pass
+    __slots__ = ()
 
 
 class AX25SupervisoryFrameMixin(object):
@@ -682,18 +775,19 @@ class AX25SupervisoryFrameMixin(object):
     Common code for AX.25 all supervisory frames
     """
 
+    __slots__ = ()
+
     # Supervisory field bits
     SUPER_MASK = 0b00001100
 
     @classmethod
     def decode(cls, header, control):
-        code = int(control & cls.SUPER_MASK)
-        return cls.SUBCLASSES[code](
+        return cls.SUBCLASSES[control & cls.SUPER_MASK](
             destination=header.destination,
             source=header.source,
             repeaters=header.repeaters,
             cr=header.cr,
-            nr=int((control & cls.CONTROL_NR_MASK) >> cls.CONTROL_NR_SHIFT),
+            nr=(control & cls.CONTROL_NR_MASK) >> cls.CONTROL_NR_SHIFT,
             pf=bool(control & cls.POLL_FINAL),
         )
 
@@ -785,6 +879,8 @@ class AX25ReceiveReadyFrameMixin(AX25SupervisoryFrameMixin):
     this is a response saying "I am ready".
     """
 
+    __slots__ = ()
+
     SUPERVISOR_CODE = 0b00000000
 
 
@@ -797,6 +893,8 @@ class AX25ReceiveNotReadyFrameMixin(AX25SupervisoryFrameMixin):
     we're ready to receive them.
     """
 
+    __slots__ = ()
+
     SUPERVISOR_CODE = 0b00000100
 
 
@@ -809,6 +907,8 @@ class AX25RejectFrameMixin(AX25SupervisoryFrameMixin):
     follows must be re-sent.
     """
 
+    __slots__ = ()
+
     SUPERVISOR_CODE = 0b00001000
 
 
@@ -820,6 +920,8 @@ class AX25SelectiveRejectFrameMixin(AX25SupervisoryFrameMixin):
     There is no requirement to send subsequent frames.
     """
 
+    __slots__ = ()
+
     SUPERVISOR_CODE = 0b00001100
 
 
@@ -827,49 +929,51 @@ class AX25SelectiveRejectFrameMixin(AX25SupervisoryFrameMixin):
 
 
 class AX258BitReceiveReadyFrame(AX25ReceiveReadyFrameMixin, AX258BitFrame):
-    pass
+    __slots__ = ()
 
 
 class AX2516BitReceiveReadyFrame(AX25ReceiveReadyFrameMixin, AX2516BitFrame):
-    pass
+    __slots__ = ()
 
 
 class AX258BitReceiveNotReadyFrame(
     AX25ReceiveNotReadyFrameMixin, AX258BitFrame
 ):
-    pass
+    __slots__ = ()
 
 
 class AX2516BitReceiveNotReadyFrame(
     AX25ReceiveNotReadyFrameMixin, AX2516BitFrame
 ):
-    pass
+    __slots__ = ()
 
 
 class AX258BitRejectFrame(AX25RejectFrameMixin, AX258BitFrame):
-    pass
+    __slots__ = ()
 
 
 class AX2516BitRejectFrame(AX25RejectFrameMixin, AX2516BitFrame):
-    pass
+    __slots__ = ()
 
 
 class AX258BitSelectiveRejectFrame(
     AX25SelectiveRejectFrameMixin, AX258BitFrame
 ):
-    pass
+    __slots__ = ()
 
 
 class AX2516BitSelectiveRejectFrame(
     AX25SelectiveRejectFrameMixin, AX2516BitFrame
 ):
-    pass
+    __slots__ = ()
 
 
 # 8 and 16-bit variants of the base class
 
 
 class AX258BitSupervisoryFrame(AX25SupervisoryFrameMixin, AX258BitFrame):
+    __slots__ = ()
+
     SUBCLASSES = dict(
         [
             (c.SUPERVISOR_CODE, c)
@@ -884,6 +988,8 @@ class AX258BitSupervisoryFrame(AX25SupervisoryFrameMixin, AX258BitFrame):
 
 
 class AX2516BitSupervisoryFrame(AX25SupervisoryFrameMixin, AX2516BitFrame):
+    __slots__ = ()
+
     SUBCLASSES = dict(
         [
             (c.SUPERVISOR_CODE, c)
@@ -905,6 +1011,8 @@ class AX25UnnumberedInformationFrame(AX25UnnumberedFrame):
     A representation of an un-numbered information frame.
     """
 
+    __slots__ = ()
+
     MODIFIER = 0b00000011
 
     @classmethod
@@ -959,10 +1067,12 @@ class AX25UnnumberedInformationFrame(AX25UnnumberedFrame):
 
     @property
     def frame_payload(self):
-        return (
-            super(AX25UnnumberedInformationFrame, self).frame_payload
-            + bytearray([self.pid])
-            + self.payload
+        return b"".join(
+            (
+                super(AX25UnnumberedInformationFrame, self).frame_payload,
+                bytes((self.pid,)),
+                self.payload,
+            )
         )
 
     def __str__(self):
@@ -1018,6 +1128,17 @@ class AX25FrameRejectFrame(AX25UnnumberedFrame):
     Not much effort has been made to decode the meaning of these bits.
     """
 
+    __slots__ = (
+        "_w",
+        "_x",
+        "_y",
+        "_z",
+        "_frmr_cr",
+        "_frmr_control",
+        "_vr",
+        "_vs",
+    )
+
     # fmt: off
     MODIFIER = 0b10000111
     W_MASK   = 0b00000001
@@ -1037,15 +1158,10 @@ class AX25FrameRejectFrame(AX25UnnumberedFrame):
             raise ValueError("Payload of FRMR must be 3 bytes")
 
         # W, X, Y and Z bits
-        w = bool(data[0] & cls.W_MASK)
-        x = bool(data[0] & cls.X_MASK)
-        y = bool(data[0] & cls.Y_MASK)
-        z = bool(data[0] & cls.Z_MASK)
+        (w, x, y, z) = _FRMR_WXYZ[data[0]]
 
         # VR, CR and VS fields
-        vr = (data[1] & cls.VR_MASK) >> cls.VR_POS
-        cr = bool(data[1] & cls.CR_MASK)
-        vs = (data[1] & cls.VS_MASK) >> cls.VS_POS
+        (vr, cr, vs) = _FRMR_VRCRVS[data[1]]
 
         # Control field of rejected frame
         frmr_control = data[2]
@@ -1105,30 +1221,24 @@ class AX25FrameRejectFrame(AX25UnnumberedFrame):
 
     @property
     def frame_payload(self):
-        return super(AX25FrameRejectFrame, self).frame_payload + bytes(
-            self._gen_frame_payload()
-        )
+        # The rejected control field must fit in its single byte; report
+        # this as a ValueError as other encoding range errors are.
+        if not (0 <= self._frmr_control <= 0xFF):
+            raise ValueError("frmr_control must be in range(0, 256)")
+
+        # FRMR is always an 8-bit frame, so the control byte and the
+        # information field can be packed in one go.
+        return _FRMR_PAYLOAD.pack(self.control, *self._gen_frame_payload())
 
     def _gen_frame_payload(self):
-        wxyz = 0
-        if self._w:
-            wxyz |= self.W_MASK
-        if self._x:
-            wxyz |= self.X_MASK
-        if self._y:
-            wxyz |= self.Y_MASK
-        if self._z:
-            wxyz |= self.Z_MASK
-        yield wxyz
-
-        vrcrvs = 0
-        vrcrvs |= (self._vr << self.VR_POS) & self.VR_MASK
-        if self._frmr_cr:
-            vrcrvs |= self.CR_MASK
-        vrcrvs |= (self._vs << self.VS_POS) & self.VS_MASK
-        yield vrcrvs
-
-        yield self._frmr_control
+        # The flags are stored as bools, so shift them into place.
+        wxyz = self._w | (self._x << 1) | (self._y << 2) | (self._z << 3)
+        vrcrvs = (
+            ((self._vr << self.VR_POS) & self.VR_MASK)
+            | (self._frmr_cr << 4)
+            | ((self._vs << self.VS_POS) & self.VS_MASK)
+        )
+        return (wxyz, vrcrvs, self._frmr_control)
 
     @property
     def w(self):
@@ -1191,6 +1301,8 @@ class AX25BaseUnnumberedFrame(AX25UnnumberedFrame):
     information fields.
     """
 
+    __slots__ = ()
+
     # Defaults for PF, CR fields
     PF = True
     CR = False
@@ -1256,6 +1368,8 @@ class AX25SetAsyncBalancedModeFrame(AX25BaseUnnumberedFrame):
     AX.25 node.
     """
 
+    __slots__ = ()
+
     MODIFIER = 0b00101111
     CR = True
 
@@ -1271,6 +1385,8 @@ class AX25SetAsyncBalancedModeExtendedFrame(AX25BaseUnnumberedFrame):
     AX.25 node, using modulo 128 acknowledgements.
     """
 
+    __slots__ = ()
+
     MODIFIER = 0b01101111
     CR = True
 
@@ -1285,6 +1401,8 @@ class AX25DisconnectFrame(AX25BaseUnnumberedFrame):
     This frame is used to initiate a disconnection from the other station.
     """
 
+    __slots__ = ()
+
     MODIFIER = 0b01000011
     CR = True
 
@@ -1300,6 +1418,8 @@ class AX25DisconnectModeFrame(AX25BaseUnnumberedFrame):
     disconnected.
     """
 
+    __slots__ = ()
+
     MODIFIER = 0b00001111
     CR = False
 
@@ -1343,13 +1463,24 @@ class AX25XIDParameterIdentifier(enum.Enum):
         return self.value
 
 
+# Known PIs indexed by their raw value, so the frequent lookup of a PI
+# (known or not) does not go through the enum constructor and its
+# exception path for unknown values.
+_XID_PI = dict((int(pi), pi) for pi in AX25XIDParameterIdentifier)
+
+
 class AX25XIDParameter(object):
     """
     Representation of a single XID parameter.
     """
 
+    __slots__ = ("_pi",)
+
     PARAMETERS = {}
 
+    # Registered sub-classes indexed by raw PI value, for decoding.
+    _DECODERS = [None] * 256
+
     @classmethod
     def register(cls, subclass):
         """
@@ -1357,6 +1488,7 @@ class AX25XIDParameter(object):
         """
         assert subclass.PI not in cls.PARAMETERS
         cls.PARAMETERS[subclass.PI] = subclass
+        cls._DECODERS[int(subclass.PI)] = subclass
 
     @classmethod
     def decode(cls, data):
@@ -1364,41 +1496,46 @@ class AX25XIDParameter(object):
         Decode the parameter value given, return the parameter and the
         remaining data.
         """
-        if len(data) < 2:
+        (param, end) = cls._decode_at(data, 0)
+        return (param, data[end:])
+
+    @classmethod
+    def _decode_at(cls, data, offset):
+        """
+        Decode the parameter starting at the given offset, return the
+        parameter and the offset of the data that follows it.
+        """
+        start = offset + 2
+        if len(data) < start:
             raise ValueError("Insufficient data for parameter")
 
-        pi = data[0]
-        pl = data[1]
-        data = data[2:]
+        (pi, pl) = _XID_PARAM_HDR.unpack_from(data, offset)
+        end = start + pl
 
         if pl > 0:
-            if len(data) < pl:
+            if len(data) < end:
                 raise ValueError("Parameter is truncated")
-            pv = data[0:pl]
-            data = data[pl:]
+            pv = data[start:end]
         else:
             pv = None
 
-        try:
-            # Hand to the sub-class to decode
-            param = cls.PARAMETERS[AX25XIDParameterIdentifier(pi)].decode(pv)
-        except (KeyError, ValueError):
-            # Not recognised, so return a base class
-            param = AX25XIDRawParameter(pi=pi, pv=pv)
+        subclass = cls._DECODERS[pi]
+        if subclass is not None:
+            try:
+                # Hand to the sub-class to decode
+                return (subclass.decode(pv), end)
+            except ValueError:
+                pass
 
-        return (param, data)
+        # Not recognised, so return a base class
+        return (AX25XIDRawParameter(pi=pi, pv=pv), end)
 
     def __init__(self, pi):
         """
         Create a new XID parameter
         """
-        try:
-            pi = AX25XIDParameterIdentifier(pi)
-        except ValueError:
-            # Pass through the PI as given.
-            pass
-
-        self._pi = pi
+        # Unrecognised PIs are passed through as given.
+        self._pi = _XID_PI.get(pi, pi)
 
     @property
     def pi(self):
@@ -1421,14 +1558,12 @@ class AX25XIDParameter(object):
         Return the encoded parameter value.
         """
         pv = self.pv
-        param = bytes([int(self.pi)])
 
         if pv is None:
-            param += bytes([0])
-        else:
-            param += bytes([len(pv)]) + pv
+            return _XID_PARAM_HDR.pack(int(self.pi), 0)
 
-        return param
+        # PI and PL are packed in one go, then joined with the PV.
+        return _XID_PARAM_HDR.pack(int(self.pi), len(pv)) + pv
 
     def copy(self):  # pragma: no cover
         """
@@ -1444,6 +1579,8 @@ class AX25XIDRawParameter(AX25XIDParameter):
     Representation of a single XID parameter that we don't recognise.
     """
 
+    __slots__ = ("_pv",)
+
     def __init__(self, pi, pv):
         """
         Create a new XID parameter
@@ -1464,7 +1601,11 @@ class AX25XIDRawParameter(AX25XIDParameter):
         """
         Return a copy of this parameter.
         """
-        return self.__class__(pi=self.pi, pv=self.pv)
+        # The PV is already validated bytes, so skip the constructor.
+        param = self.__class__.__new__(self.__class__)
+        param._pv = self._pv
+        super(AX25XIDRawParameter, param).__init__(pi=self.pi)
+        return param
 
 
 class AX25XIDClassOfProceduresParameter(AX25XIDParameter):
@@ -1473,6 +1614,8 @@ class AX25XIDClassOfProceduresParameter(AX25XIDParameter):
     half or full duplex communications between two TNCs.
     """
 
+    __slots__ = ("_word",)
+
     PI = AX25XIDParameterIdentifier.ClassesOfProcedure
 
     # fmt: off
@@ -1491,17 +1634,17 @@ class AX25XIDClassOfProceduresParameter(AX25XIDParameter):
     @classmethod
     def decode(cls, pv):
         # Decode the PV
-        pv = uint.decode(pv, big_endian=True)
-        return cls(
-            full_duplex=bool(pv & cls.FULL_DUPLEX),
-            half_duplex=bool(pv & cls.HALF_DUPLEX),
-            unbalanced_nrm_pri=bool(pv & cls.UNBALANCED_NRM_PRI),
-            unbalanced_nrm_sec=bool(pv & cls.UNBALANCED_NRM_SEC),
-            unbalanced_arm_pri=bool(pv & cls.UNBALANCED_ARM_PRI),
-            unbalanced_arm_sec=bool(pv & cls.UNBALANCED_ARM_SEC),
-            balanced_abm=bool(pv & cls.BALANCED_ABM),
-            reserved=((pv & cls.RESERVED_MASK) >> cls.RESERVED_POS),
-        )
+        return cls._from_word(uint.decode(pv, big_endian=True))
+
+    @classmethod
+    def _from_word(cls, word):
+        """
+        Create the parameter directly from its 16-bit value.
+        """
+        param = cls.__new__(cls)
+        param._word = word & 0xFFFF
+        super(AX25XIDClassOfProceduresParameter, param).__init__(pi=cls.PI)
+        return param
 
     def __init__(
         self,
@@ -1518,77 +1661,59 @@ class AX25XIDClassOfProceduresParameter(AX25XIDParameter):
         Create a Class Of Procedures XID parameter.  The defaults are set
         so that at most, only half_duplex or full_duplex should need setting.
         """
-        self._half_duplex = half_duplex
-        self._full_duplex = full_duplex
-        self._unbalanced_nrm_pri = unbalanced_nrm_pri
-        self._unbalanced_nrm_sec = unbalanced_nrm_sec
-        self._unbalanced_arm_pri = unbalanced_arm_pri
-        self._unbalanced_arm_sec = unbalanced_arm_sec
-        self._balanced_abm = balanced_abm
-        self._reserved = reserved
+        # All fields are kept packed in the 16-bit value sent over the air.
+        self._word = (
+            ((reserved << self.RESERVED_POS) & self.RESERVED_MASK)
+            | (self.FULL_DUPLEX if full_duplex else 0)
+            | (self.HALF_DUPLEX if half_duplex else 0)
+            | (self.UNBALANCED_NRM_PRI if unbalanced_nrm_pri else 0)
+            | (self.UNBALANCED_NRM_SEC if unbalanced_nrm_sec else 0)
+            | (self.UNBALANCED_ARM_PRI if unbalanced_arm_pri else 0)
+            | (self.UNBALANCED_ARM_SEC if unbalanced_arm_sec else 0)
+            | (self.BALANCED_ABM if balanced_abm else 0)
+        )
         super(AX25XIDClassOfProceduresParameter, self).__init__(pi=self.PI)
 
     @property
     def pv(self):
         # We reproduce all bits as given, even if the combination is invalid
-        # Value is encoded in little-endian format as two bytes.
-        return uint.encode(
-            (
-                ((self.reserved << self.RESERVED_POS) & self.RESERVED_MASK)
-                | ((self.full_duplex and self.FULL_DUPLEX) or 0)
-                | ((self.half_duplex and self.HALF_DUPLEX) or 0)
-                | ((self.unbalanced_nrm_pri and self.UNBALANCED_NRM_PRI) or 0)
-                | ((self.unbalanced_nrm_sec and self.UNBALANCED_NRM_SEC) or 0)
-                | ((self.unbalanced_arm_pri and self.UNBALANCED_ARM_PRI) or 0)
-                | ((self.unbalanced_arm_sec and self.UNBALANCED_ARM_SEC) or 0)
-                | ((self.balanced_abm and self.BALANCED_ABM) or 0)
-            ),
-            big_endian=True,
-            length=2,
-        )
+        # Value is encoded in big-endian format as two bytes.
+        return uint.encode(self._word, big_endian=True, length=2)
 
     @property
     def half_duplex(self):
-        return self._half_duplex
+        return bool(self._word & self.HALF_DUPLEX)
 
     @property
     def full_duplex(self):
-        return self._full_duplex
+        return bool(self._word & self.FULL_DUPLEX)
 
     @property
     def unbalanced_nrm_pri(self):
-        return self._unbalanced_nrm_pri
+        return bool(self._word & self.UNBALANCED_NRM_PRI)
 
     @property
     def unbalanced_nrm_sec(self):
-        return self._unbalanced_nrm_sec
+        return bool(self._word & self.UNBALANCED_NRM_SEC)
 
     @property
     def unbalanced_arm_pri(self):
-        return self._unbalanced_arm_pri
+        return bool(self._word & self.UNBALANCED_ARM_PRI)
 
     @property
     def unbalanced_arm_sec(self):
-        return self._unbalanced_arm_sec
+        return bool(self._word & self.UNBALANCED_ARM_SEC)
 
     @property
     def balanced_abm(self):
-        return self._balanced_abm
+        return bool(self._word & self.BALANCED_ABM)
 
     @property
     def reserved(self):
-        return self._reserved
+        return (self._word & self.RESERVED_MASK) >> self.RESERVED_POS
 
     def copy(self):
-        return self.__class__(
-            half_duplex=self.half_duplex,
-            full_duplex=self.full_duplex,
-            unbalanced_nrm_pri=self.unbalanced_nrm_pri,
-            unbalanced_nrm_sec=self.unbalanced_nrm_sec,
-            unbalanced_arm_pri=self.unbalanced_arm_pri,
-            unbalanced_arm_sec=self.unbalanced_arm_sec,
-            reserved=self.reserved,
-        )
+        return self._from_word(self._word)
 
 
 AX25XIDParameter.register(AX25XIDClassOfProceduresParameter)
@@ -1609,6 +1734,8 @@ class AX25XIDHDLCOptionalFunctionsParameter(AX25XIDParameter):
     synchronise communications.
     """
 
+    __slots__ = ("_word",)
+
     PI = AX25XIDParameterIdentifier.HDLCOptionalFunctions
 
     # fmt: off
@@ -1642,32 +1769,19 @@ class AX25XIDHDLCOptionalFunctionsParameter(AX25XIDParameter):
     @classmethod
     def decode(cls, pv):
         # Decode the PV
-        pv = uint.decode(pv, big_endian=False)
-        return cls(
-            modulo128=bool(pv & cls.MODULO128),
-            modulo8=bool(pv & cls.MODULO8),
-            srej=bool(pv & cls.SREJ),
-            rej=bool(pv & cls.REJ),
-            srej_multiframe=bool(pv & cls.SREJ_MULTIFRAME),
-            start_stop_transp=bool(pv & cls.START_STOP_TRANSP),
-            start_stop_flow_ctl=bool(pv & cls.START_STOP_FLOW_CTL),
-            start_stop_tx=bool(pv & cls.START_STOP_TX),
-            sync_tx=bool(pv & cls.SYNC_TX),
-            fcs32=bool(pv & cls.FCS32),
-            fcs16=bool(pv & cls.FCS16),
-            rd=bool(pv & cls.RD),
-            test=bool(pv & cls.TEST),
-            rset=bool(pv & cls.RSET),
-            delete_i_cmd=bool(pv & cls.DELETE_I_CMD),
-            delete_i_resp=bool(pv & cls.DELETE_I_RESP),
-            extd_addr=bool(pv & cls.EXTD_ADDR),
-            basic_addr=bool(pv & cls.BASIC_ADDR),
-            up=bool(pv & cls.UP),
-            sim_rim=bool(pv & cls.SIM_RIM),
-            ui=bool(pv & cls.UI),
-            reserved2=(pv & cls.RESERVED2_MASK) >> cls.RESERVED2_POS,
-            reserved1=bool(pv & cls.RESERVED1),
+        return cls._from_word(uint.decode(pv, big_endian=False))
+
+    @classmethod
+    def _from_word(cls, word):
+        """
+        Create the parameter directly from its 24-bit value.
+        """
+        param = cls.__new__(cls)
+        param._word = word & 0xFFFFFF
+        super(AX25XIDHDLCOptionalFunctionsParameter, param).__init__(
+            pi=cls.PI
         )
+        return param
 
     def __init__(
         self,
@@ -1699,29 +1813,32 @@ class AX25XIDHDLCOptionalFunctionsParameter(AX25XIDParameter):
         HDLC Optional Features XID parameter.  The defaults are set
         so that at most, only srej, rej, modulo8 and/or modulo128 need setting.
         """
-        self._modulo128 = modulo128
-        self._modulo8 = modulo8
-        self._srej = srej
-        self._rej = rej
-        self._srej_multiframe = srej_multiframe
-        self._start_stop_transp = start_stop_transp
-        self._start_stop_flow_ctl = start_stop_flow_ctl
-        self._start_stop_tx = start_stop_tx
-        self._sync_tx = sync_tx
-        self._fcs32 = fcs32
-        self._fcs16 = fcs16
-        self._rd = rd
-        self._test = test
-        self._rset = rset
-        self._delete_i_cmd = delete_i_cmd
-        self._delete_i_resp = delete_i_resp
-        self._extd_addr = extd_addr
-        self._basic_addr = basic_addr
-        self._up = up
-        self._sim_rim = sim_rim
-        self._ui = ui
-        self._reserved2 = reserved2
-        self._reserved1 = reserved1
+        # All fields are kept packed in the 24-bit value sent over the air.
+        self._word = (
+            ((reserved2 << self.RESERVED2_POS) & self.RESERVED2_MASK)
+            | (self.MODULO128 if modulo128 else 0)
+            | (self.MODULO8 if modulo8 else 0)
+            | (self.SREJ if srej else 0)
+            | (self.REJ if rej else 0)
+            | (self.SREJ_MULTIFRAME if srej_multiframe else 0)
+            | (self.START_STOP_TRANSP if start_stop_transp else 0)
+            | (self.START_STOP_FLOW_CTL if start_stop_flow_ctl else 0)
+            | (self.START_STOP_TX if start_stop_tx else 0)
+            | (self.SYNC_TX if sync_tx else 0)
+            | (self.FCS32 if fcs32 else 0)
+            | (self.FCS16 if fcs16 else 0)
+            | (self.RD if rd else 0)
+            | (self.TEST if test else 0)
+            | (self.RSET if rset else 0)
+            | (self.DELETE_I_CMD if delete_i_cmd else 0)
+            | (self.DELETE_I_RESP if delete_i_resp else 0)
+            | (self.EXTD_ADDR if extd_addr else 0)
+            | (self.BASIC_ADDR if basic_addr else 0)
+            | (self.UP if up else 0)
+            | (self.SIM_RIM if sim_rim else 0)
+            | (self.UI if ui else 0)
+            | (self.RESERVED1 if reserved1 else 0)
+        )
 
         super(AX25XIDHDLCOptionalFunctionsParameter, self).__init__(
             pi=self.PI
@@ -1730,157 +1847,102 @@ class AX25XIDHDLCOptionalFunctionsParameter(AX25XIDParameter):
     @property
     def pv(self):
         # We reproduce all bits as given, even if the combination is invalid
-        return uint.encode(
-            (
-                ((self.reserved2 << self.RESERVED2_POS) & self.RESERVED2_MASK)
-                | ((self.modulo128 and self.MODULO128) or 0)
-                | ((self.modulo8 and self.MODULO8) or 0)
-                | ((self.srej and self.SREJ) or 0)
-                | ((self.rej and self.REJ) or 0)
-                | ((self.srej_multiframe and self.SREJ_MULTIFRAME) or 0)
-                | ((self.start_stop_transp and self.START_STOP_TRANSP) or 0)
-                | (
-                    (self.start_stop_flow_ctl and self.START_STOP_FLOW_CTL)
-                    or 0
-                )
-                | ((self.start_stop_tx and self.START_STOP_TX) or 0)
-                | ((self.sync_tx and self.SYNC_TX) or 0)
-                | ((self.fcs32 and self.FCS32) or 0)
-                | ((self.fcs16 and self.FCS16) or 0)
-                | ((self.rd and self.RD) or 0)
-                | ((self.test and self.TEST) or 0)
-                | ((self.rset and self.RSET) or 0)
-                | ((self.delete_i_cmd and self.DELETE_I_CMD) or 0)
-                | ((self.delete_i_resp and self.DELETE_I_RESP) or 0)
-                | ((self.extd_addr and self.EXTD_ADDR) or 0)
-                | ((self.basic_addr and self.BASIC_ADDR) or 0)
-                | ((self.up and self.UP) or 0)
-                | ((self.sim_rim and self.SIM_RIM) or 0)
-                | ((self.ui and self.UI) or 0)
-                | ((self.reserved1 and self.RESERVED1) or 0)
-            ),
-            big_endian=False,
-            length=3,
-        )
+        return uint.encode(self._word, big_endian=False, length=3)
 
     @property
     def modulo128(self):
-        return self._modulo128
+        return bool(self._word & self.MODULO128)
 
     @property
     def modulo8(self):
-        return self._modulo8
+        return bool(self._word & self.MODULO8)
 
     @property
     def srej(self):
-        return self._srej
+        return bool(self._word & self.SREJ)
 
     @property
     def rej(self):
-        return self._rej
+        return bool(self._word & self.REJ)
 
     @property
     def srej_multiframe(self):
-        return self._srej_multiframe
+        return bool(self._word & self.SREJ_MULTIFRAME)
 
     @property
     def start_stop_transp(self):
-        return self._start_stop_transp
+        return bool(self._word & self.START_STOP_TRANSP)
 
     @property
     def start_stop_flow_ctl(self):
-        return self._start_stop_flow_ctl
+        return bool(self._word & self.START_STOP_FLOW_CTL)
 
     @property
     def start_stop_tx(self):
-        return self._start_stop_tx
+        return bool(self._word & self.START_STOP_TX)
 
     @property
     def sync_tx(self):
-        return self._sync_tx
+        return bool(self._word & self.SYNC_TX)
 
     @property
     def fcs32(self):
-        return self._fcs32
+        return bool(self._word & self.FCS32)
 
     @property
     def fcs16(self):
-        return self._fcs16
+        return bool(self._word & self.FCS16)
 
     @property
     def rd(self):
-        return self._rd
+        return bool(self._word & self.RD)
 
     @property
     def test(self):
-        return self._test
+        return bool(self._word & self.TEST)
 
     @property
     def rset(self):
-        return self._rset
+        return bool(self._word & self.RSET)
 
     @property
     def delete_i_cmd(self):
-        return self._delete_i_cmd
+        return bool(self._word & self.DELETE_I_CMD)
 
     @property
     def delete_i_resp(self):
-        return self._delete_i_resp
+        return bool(self._word & self.DELETE_I_RESP)
 
     @property
     def extd_addr(self):
-        return self._extd_addr
+        return bool(self._word & self.EXTD_ADDR)
 
     @property
     def basic_addr(self):
-        return self._basic_addr
+        return bool(self._word & self.BASIC_ADDR)
 
     @property
     def up(self):
-        return self._up
+        return bool(self._word & self.UP)
 
     @property
     def sim_rim(self):
-        return self._sim_rim
+        return bool(self._word & self.SIM_RIM)
 
     @property
     def ui(self):
-        return self._ui
+        return bool(self._word & self.UI)
 
     @property
     def reserved2(self):
-        return self._reserved2
+        return (self._word & self.RESERVED2_MASK) >> self.RESERVED2_POS
 
     @property
     def reserved1(self):
-        return self._reserved1
+        return bool(self._word & self.RESERVED1)
 
     def copy(self):
-        return self.__class__(
-            modulo128=self.modulo128,
-            modulo8=self.modulo8,
-            srej=self.srej,
-            rej=self.rej,
-            srej_multiframe=self.srej_multiframe,
-            start_stop_transp=self.start_stop_transp,
-            start_stop_flow_ctl=self.start_stop_flow_ctl,
-            start_stop_tx=self.start_stop_tx,
-            sync_tx=self.sync_tx,
-            fcs32=self.fcs32,
-            fcs16=self.fcs16,
-            rd=self.rd,
-            test=self.test,
-            rset=self.rset,
-            delete_i_cmd=self.delete_i_cmd,
-            delete_i_resp=self.delete_i_resp,
-            extd_addr=self.extd_addr,
-            basic_addr=self.basic_addr,
-            up=self.up,
-            sim_rim=self.sim_rim,
-            ui=self.ui,
-            reserved2=self.reserved2,
-            reserved1=self.reserved1,
-        )
+        return self._from_word(self._word)
 
 
 AX25XIDParameter.register(AX25XIDHDLCOptionalFunctionsParameter)
@@ -1900,6 +1962,8 @@ class AX25XIDBigEndianParameter(AX25XIDParameter):
     timers, retries).
     """
 
+    __slots__ = ("_value",)
+
     LENGTH = None
 
     @classmethod
@@ -1926,10 +1990,16 @@ class AX25XIDBigEndianParameter(AX25XIDParameter):
         return self._value
 
     def copy(self):
-        return self.__class__(value=self.value)
+        # The value is already type-checked, so skip the constructor.
+        param = self.__class__.__new__(self.__class__)
+        param._value = self._value
+        super(AX25XIDBigEndianParameter, param).__init__(pi=self.PI)
+        return param
 
 
 class AX25XIDIFieldLengthTransmitParameter(AX25XIDBigEndianParameter):
+    __slots__ = ()
+
     PI = AX25XIDParameterIdentifier.IFieldLengthTransmit
 
 
@@ -1937,6 +2007,8 @@ AX25XIDParameter.register(AX25XIDIFieldLengthTransmitParameter)
 
 
 class AX25XIDIFieldLengthReceiveParameter(AX25XIDBigEndianParameter):
+    __slots__ = ()
+
     PI = AX25XIDParameterIdentifier.IFieldLengthReceive
 
 
@@ -1948,6 +2020,8 @@ AX25_22_DEFAULT_XID_IFIELDRX = AX25XIDIFieldLengthReceiveParameter(2048)
 
 
 class AX25XIDWindowSizeTransmitParameter(AX25XIDBigEndianParameter):
+    __slots__ = ()
+
     PI = AX25XIDParameterIdentifier.WindowSizeTransmit
     LENGTH = 1
 
@@ -1956,6 +2030,8 @@ AX25XIDParameter.register(AX25XIDWindowSizeTransmitParameter)
 
 
 class AX25XIDWindowSizeReceiveParameter(AX25XIDBigEndianParameter):
+    __slots__ = ()
+
     PI = AX25XIDParameterIdentifier.WindowSizeReceive
     LENGTH = 1
 
@@ -1968,6 +2044,8 @@ AX25_22_DEFAULT_XID_WINDOWSZRX = AX25XIDIFieldLengthReceiveParameter(7)
 
 
 class AX25XIDAcknowledgeTimerParameter(AX25XIDBigEndianParameter):
+    __slots__ = ()
+
     PI = AX25XIDParameterIdentifier.AcknowledgeTimer
 
 
@@ -1979,6 +2057,8 @@ AX25_22_DEFAULT_XID_ACKTIMER = AX25XIDIFieldLengthReceiveParameter(3000)
 
 
 class AX25XIDRetriesParameter(AX25XIDBigEndianParameter):
+    __slots__ = ()
+
     PI = AX25XIDParameterIdentifier.Retries
 
 
@@ -1996,6 +2076,8 @@ class AX25ExchangeIdentificationFrame(AX25UnnumberedFrame):
     This frame is used to negotiate TNC features.
     """
 
+    __slots__ = ("_fi", "_gi", "_parameters")
+
     MODIFIER = 0b10101111
 
     @classmethod
@@ -2003,18 +2085,17 @@ class AX25ExchangeIdentificationFrame(AX25UnnumberedFrame):
         if len(data) < 4:
             raise ValueError("Truncated XID header")
 
-        fi = data[0]
-        gi = data[1]
         # Yep, GL is big-endian, just for a change!
-        gl = uint.decode(data[2:4], big_endian=True)
-        data = data[4:]
+        (fi, gi, gl) = _XID_HDR.unpack_from(data, 0)
+        end = len(data)
 
-        if len(data) != gl:
+        if (end - 4) != gl:
             raise ValueError("Truncated XID data")
 
         parameters = []
-        while data:
-            (param, data) = AX25XIDParameter.decode(data)
+        offset = 4
+        while offset < end:
+            (param, offset) = AX25XIDParameter._decode_at(data, offset)
             parameters.append(param)
 
         return cls(
@@ -2073,11 +2154,14 @@ class AX25ExchangeIdentificationFrame(AX25UnnumberedFrame):
 
     @property
     def frame_payload(self):
-        parameters = b"".join([bytes(param) for param in self.parameters])
-        return (
-            super(AX25ExchangeIdentificationFrame, self).frame_payload
-            + bytes([self.fi, self.gi])
-            + uint.encode(len(parameters), length=2, big_endian=True)
+        parameters = [bytes(param) for param in self.parameters]
+        return b"".join(
+            [
+                super(AX25ExchangeIdentificationFrame, self).frame_payload,
+                _XID_HDR.pack(
+                    self.fi, self.gi, sum(len(p) for p in parameters)
+                ),
+            ]
             + parameters
         )
 
@@ -2104,6 +2188,8 @@ class AX25UnnumberedAcknowledgeFrame(AX25BaseUnnumberedFrame):
     This frame is used to acknowledge a SABM/SABME frame.
     """
 
+    __slots__ = ()
+
     MODIFIER = 0b01100011
     CR = False
 
@@ -2118,6 +2204,8 @@ class AX25TestFrame(AX25UnnumberedFrame):
     This frame is used to initiate an echo request.
     """
 
+    __slots__ = ()
+
     MODIFIER = 0b11100011
 
     @classmethod
@@ -2160,7 +2248,9 @@ class AX25TestFrame(AX25UnnumberedFrame):
 
     @property
     def frame_payload(self):
-        return super(AX25TestFrame, self).frame_payload + bytes(self.payload)
+        return b"".join(
+            (super(AX25TestFrame, self).frame_payload, self.payload)
+        )
 
     def _copy(self):
         return self.__class__(
@@ -2183,17 +2273,47 @@ class AX25FrameHeader(object):
     A representation of an AX.25 frame header.
     """
 
+    __slots__ = (
+        "_destination",
+        "_source",
+        "_repeaters",
+        "_cr",
+        "_src_cr",
+        "_legacy",
+    )
+
     @classmethod
     def decode(cls, data):
         """
         Decode a frame header from the data given, return the
         decoded header and the data remaining.
         """
-        # Decode the addresses
+        # Decode the addresses.  Each address is 7 bytes, the extension bit
+        # in the last byte of each tells us whether another one follows.
         addresses = []
-        while data and (not (addresses and addresses[-1].extension)):
-            addresses.append(AX25Address.decode(data))
-            data = data[7:]
+        offset = 0
+        length = len(data)
+        more = True
+        if (length >= 14) and not (data[6] & 0b00000001):
+            # Every frame starts with a destination and source address, so
+            # pull both out in one call.
+            (destination, source) = _ADDRESS_PAIR.unpack_from(data)
+            addresses = [
+                AX25Address.decode(destination),
+                AX25Address.decode(source),
+            ]
+            offset = 14
+            more = not (data[13] & 0b00000001)
+
+        while more and (offset < length):
+            end = offset + 7
+            if end > length:
+                raise ValueError("AX.25 addresses must be 7 bytes!")
+            (address,) = _ADDRESS.unpack_from(data, offset)
+            addresses.append(AX25Address.decode(address))
+            offset = end
+            more = not (data[end - 1] & 0b00000001)
+        data = data[offset:]
 
         # Whatever's left is the frame payload data.
         if len(addresses) < 2:
@@ -2231,19 +2351,19 @@ class AX25FrameHeader(object):
         """
         Generate an encoded AX.25 frame header
         """
+        parts = []
+
         # Extension bit should be 0
         # CH bit should be 1 for command, 0 for response
         self._destination.extension = False
         self._destination.ch = self.cr
-        for byte in bytes(self._destination):
-            yield byte
+        parts.append(bytes(self._destination))
 
         # Extension bit should be 0 if digipeaters follow, 1 otherwise
         # CH bit should be 0 for command, 1 for response
         self._source.extension = not bool(self._repeaters)
         self._source.ch = self.src_cr
-        for byte in bytes(self._source):
-            yield byte
+        parts.append(bytes(self._source))
 
         # Digipeaters
         if self._repeaters:
@@ -2253,9 +2373,9 @@ class AX25FrameHeader(object):
                 rpt.extension = False
             self._repeaters[-1].extension = True
 
-            for rpt in self._repeaters:
-                for byte in bytes(rpt):
-                    yield byte
+            parts.extend(bytes(rpt) for rpt in self._repeaters)
+
+        return b"".join(parts)
 
     def __str__(self):
         """
@@ -2271,7 +2391,7 @@ class AX25FrameHeader(object):
         """
         Encode the AX.25 frame header
         """
-        return bytes(self._encode())
+        return self._encode()
 
     @property
     def destination(self):
@@ -2354,7 +2474,7 @@ class AX25Path(Sequence):
         """
         Return a string representation of the digipeater path.
         """
-        return ",".join(str(addr) for addr in self._path)
+        return ",".join(map(str, self._path))
 
     def __repr__(self):
         """
@@ -2371,14 +2491,7 @@ class AX25Path(Sequence):
         Return the reply path (the "consumed" digipeaters in reverse order).
         """
         return self.__class__(
-            *tuple(
-                [
-                    digi.copy(ch=False)
-                    for digi in filter(
-                        lambda digi: digi.ch, reversed(self._path)
-                    )
-                ]
-            )
+            *[digi.copy(ch=False) for digi in reversed(self._path) if digi.ch]
         )
 
     def replace(self, alias, address):
@@ -2386,15 +2499,16 @@ class AX25Path(Sequence):
         Replace an address alias (e.g. WIDE1-1) with the given address
         (e.g. the address of this station).
         """
-        alias = AX25Address.decode(alias).normalised
+        # Normalised addresses differ only in call-sign and SSID, so compare
+        # those directly rather than normalising a copy of every digipeater.
+        alias = AX25Address.decode(alias)
+        key = (alias.callsign, alias.ssid)
         address = AX25Address.decode(address)
         return self.__class__(
-            *tuple(
-                [
-                    address if (digi.normalised == alias) else digi
-                    for digi in self._path
-                ]
-            )
+            *[
+                address if ((digi.callsign, digi.ssid) == key) else digi
+                for digi in self._path
+            ]
         )
 
 
@@ -2403,30 +2517,43 @@ class AX25Address(object):
     A representation of an AX.25 address (callsign + SSID)
     """
 
+    __slots__ = (
+        "_callsign",
+        "_ssid",
+        "_ch",
+        "_res0",
+        "_res1",
+        "_extension",
+        "_encoded",
+        "_call_ssid",
+    )
+
     CALL_RE = re.compile(r"^([0-9A-Z]+)(?:-([0-9]{1,2}))?(\*?)$")
 
+    # Characters permitted in a plain call-sign with no SSID or C/H suffix.
+    # Such strings can bypass CALL_RE entirely.
+    CALL_CHARS = frozenset("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
     @classmethod
     def decode(cls, data, ssid=None):
         """
         Decode an AX.25 address from a frame.
         """
-        if isinstance(data, (bytes, bytearray)):
+        if isinstance(data, (bytes, bytearray, memoryview)):
             # Ensure the data is at least 7 bytes!
             if len(data) < 7:
                 raise ValueError("AX.25 addresses must be 7 bytes!")
 
-            # This is a binary representation in the AX.25 frame header
-            callsign = (
-                bytes([b >> 1 for b in data[0:6]]).decode("US-ASCII").strip()
-            )
-            ssid = (data[6] & 0b00011110) >> 1
-            ch = bool(data[6] & 0b10000000)
-            res1 = bool(data[6] & 0b01000000)
-            res0 = bool(data[6] & 0b00100000)
-            extension = bool(data[6] & 0b00000001)
-            return cls(callsign, ssid, ch, res0, res1, extension)
+            # This is a binary representation in the AX.25 frame header.
+            # Only the decoded fields are shared between calls; addresses
+            # are mutable, so each caller gets its own instance.
+            return cls(*_decode_address(bytes(data[0:7])))
         elif isinstance(data, str):
             # This is a human-readable representation
+            if data and cls.CALL_CHARS.issuperset(data):
+                # Bare call-sign, e.g. "VK4MSL": nothing to parse.
+                return cls(callsign=data, ssid=ssid or 0)
+
             match = cls.CALL_RE.match(data.upper())
             if not match:
                 raise ValueError("Not a valid SSID: %s" % data)
@@ -2459,12 +2586,18 @@ class AX25Address(object):
         self._res1 = bool(res1)
         self._extension = bool(extension)
 
+        # Encoded form, generated on demand by __bytes__
+        self._encoded = None
+
+        # Call-sign and SSID as text, generated on demand by __str__.  Unlike
+        # the C/H bit, neither can change after construction.
+        self._call_ssid = None
+
     def _encode(self):
         """
         Generate the encoded AX.25 address.
         """
-        for byte in self._callsign[0:6].ljust(6).encode("US-ASCII"):
-            yield (byte << 1)
+        callsign = _encode_callsign(self._callsign)
 
         # SSID byte
         ssid = self._ssid << 1
@@ -2476,23 +2609,29 @@ class AX25Address(object):
             ssid |= 0b01000000
         if self._ch:
             ssid |= 0b10000000
-        yield ssid
+
+        return callsign + bytes([ssid])
 
     def __bytes__(self):
         """
         Return the encoded call-sign.
         """
-        return bytes(self._encode())
+        if self._encoded is None:
+            self._encoded = self._encode()
+        return self._encoded
 
     def __str__(self):
         """
         Return the call-sign and SSID as a string.
         """
-        address = self.callsign
-        if self.ssid > 0:
-            address += "-%d" % self.ssid
+        address = self._call_ssid
+        if address is None:
+            address = self._callsign
+            if self._ssid > 0:
+                address += "-%d" % self._ssid
+            self._call_ssid = address
 
-        if self.ch:
+        if self._ch:
             address += "*"
         return address
 
@@ -2513,32 +2652,28 @@ class AX25Address(object):
             self.extension,
         )
 
+    def _key(self):
+        """
+        Return the fields that identify this address, for comparison and
+        hashing.
+        """
+        return (
+            self._callsign,
+            self._ssid,
+            self._extension,
+            self._res0,
+            self._res1,
+            self._ch,
+        )
+
     def __eq__(self, other):
         if not isinstance(other, AX25Address):
             return NotImplemented
 
-        for field in ("callsign", "ssid", "extension", "res0", "res1", "ch"):
-            if getattr(self, field) != getattr(other, field):
-                return False
-
-        return True
+        return self._key() == other._key()
 
     def __hash__(self):
-        return hash(
-            tuple(
-                [
-                    getattr(self, field)
-                    for field in (
-                        "callsign",
-                        "ssid",
-                        "extension",
-                        "res0",
-                        "res1",
-                        "ch",
-                    )
-                ]
-            )
-        )
+        return hash(self._key())
 
     @property
     def callsign(self):
@@ -2566,7 +2701,10 @@ class AX25Address(object):
 
     @extension.setter
     def extension(self, value):
-        self._extension = bool(value)
+        value = bool(value)
+        if value is not self._extension:
+            self._extension = value
+            self._encoded = None
 
     @property
     def res0(self):
@@ -2597,12 +2735,29 @@ class AX25Address(object):
 
     @ch.setter
     def ch(self, value):
-        self._ch = bool(value)
+        value = bool(value)
+        if value is not self._ch:
+            self._ch = value
+            self._encoded = None
 
     def copy(self, **overrides):
         """
         Return a copy of this address, optionally with fields overridden.
         """
+        if not overrides:
+            # Straight clone: the fields are already validated, so copy
+            # them (and the encoded form) across as-is.
+            clone = self.__class__.__new__(self.__class__)
+            clone._callsign = self._callsign
+            clone._ssid = self._ssid
+            clone._ch = self._ch
+            clone._res0 = self._res0
+            clone._res1 = self._res1
+            clone._extension = self._extension
+            clone._encoded = self._encoded
+            clone._call_ssid = self._call_ssid
+            return clone
+
         mydata = dict(
             callsign=self.callsign,
             ssid=self.ssid,
@@ -47,9 +47,16 @@ class Router(object):
                 "callsign must be a string (use " "regex=True for regex)"
             )
         if regex:
-            (_, call_receivers) = self._receiver_re.setdefault(
-                callsign, (re.compile(callsign), {})
-            )
+            try:
+                (_, call_receivers) = self._receiver_re[callsign]
+            except KeyError:
+                # First binding of this pattern; compile it once and keep
+                # it for matching against every received frame.
+                call_receivers = {}
+                self._receiver_re[callsign] = (
+                    re.compile(callsign),
+                    call_receivers,
+                )
         else:
             call_receivers = self._receiver_str.setdefault(callsign, {})
 
@@ -53,6 +53,20 @@ class Signal(BaseSignal):
     of whether they return something or not, or throw exceptions.
     """
 
+    def __init__(self, *args, **kwargs):
+        super(Signal, self).__init__(*args, **kwargs)
+
+        # Snapshot of the connected slots, used by emit.  This is rebuilt
+        # when slots are connected or disconnected rather than copied on
+        # every emit, since signals fire far more often than they change.
+        self._emit_slots = ()
+
+    def _update_emit_slots(self):
+        """
+        Refresh the snapshot of connected slots.
+        """
+        self._emit_slots = tuple(super(Signal, self).slots)
+
     def connect(self, slot, **kwargs):
         """
         Connect a slot to the signal.  This will wrap the given slot up in
@@ -60,6 +74,7 @@ class Signal(BaseSignal):
         the slot handles its own exceptions.
         """
         super(Signal, self).connect(Slot(slot, **kwargs))
+        self._update_emit_slots()
 
     def connect_oneshot(self, slot, **kwargs):
         """
@@ -67,6 +82,7 @@ class Signal(BaseSignal):
         signal fires.  (Disconnect after calling.)
         """
         super(Signal, self).connect(OneshotSlot(self, slot, **kwargs))
+        self._update_emit_slots()
 
     def _find_slot(self, slot):
         """
@@ -87,6 +103,15 @@ class Signal(BaseSignal):
         slot = self._find_slot(slot)
         if slot:
             super(Signal, self).disconnect(slot)
+            self._update_emit_slots()
+
+    def emit(self, **kwargs):
+        """
+        Call all connected slots with the given keyword arguments.  Slots
+        connected or disconnected during the emit take effect next time.
+        """
+        for slot in self._emit_slots:
+            slot(**kwargs)
 
     def is_connected(self, slot):
         """
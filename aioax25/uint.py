@@ -15,21 +15,15 @@ def encode(value, length=None, big_endian=False):
     length.
     """
 
-    output = bytearray()
-    while (value != 0) if (length is None) else (length > 0):
-        output += bytes([value & 0xFF])
-        value >>= 8
-        if length is not None:
-            length -= 1
+    if length is None:
+        # As few bytes as needed, but always at least one.
+        length = max(1, (value.bit_length() + 7) // 8)
+    else:
+        # Truncate to the requested size.
+        value &= (1 << (length * 8)) - 1
+        length = max(1, length)
 
-    if not output:
-        # No output, so return a null byte
-        output += b"\x00"
-
-    if big_endian:
-        output.reverse()
-
-    return bytes(output)
+    return value.to_bytes(length, "big" if big_endian else "little")
 
 
 def decode(value, big_endian=False):
@@ -37,8 +31,4 @@ def decode(value, big_endian=False):
     Decode the given bytes as an unsigned integer.
     """
 
-    output = 0
-    for byte in value if big_endian else reversed(value):
-        output <<= 8
-        output |= byte
-    return output
+    return int.from_bytes(value, "big" if big_endian else "little")
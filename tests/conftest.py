@@ -5,5 +5,9 @@ py.test configuration settings and fixture definitions.
 """
 
 from .fixtures.logger import logger
+from .fixtures.frame import vk4_addrs, vk4_path, xid_frame
 
 assert logger
+assert vk4_addrs
+assert vk4_path
+assert xid_frame
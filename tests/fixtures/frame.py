@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+"""
+Frame fixtures shared between test cases.
+"""
+
+import pytest
+
+from aioax25.frame import (
+    AX25Address,
+    AX25Path,
+    AX25ExchangeIdentificationFrame,
+    AX25XIDRawParameter,
+    AX25XIDClassOfProceduresParameter,
+    AX25XIDHDLCOptionalFunctionsParameter,
+    AX25XIDIFieldLengthReceiveParameter,
+    AX25XIDRetriesParameter,
+)
+
+
+@pytest.fixture(scope="session")
+def vk4_addrs():
+    """
+    Destination and source addresses used throughout the frame tests.
+    Frames copy the addresses they are given, so these may be shared.
+    """
+    return (AX25Address.decode("VK4BWI"), AX25Address.decode("VK4MSL"))
+
+
+@pytest.fixture(scope="session")
+def vk4_path():
+    """
+    Three-hop digipeater path used by the path tests.  Only tests that do
+    not modify the path (or its addresses) should use this.
+    """
+    return AX25Path("VK4MSL", "VK4RZB", "VK4RZA")
+
+
+@pytest.fixture(scope="module")
+def xid_frame(vk4_addrs):
+    """
+    XID frame carrying the typical negotiated parameters plus two arbitrary
+    ones.  Tests must not modify it; use .copy() to obtain a variant.
+    """
+    (destination, source) = vk4_addrs
+    return AX25ExchangeIdentificationFrame(
+        destination=destination,
+        source=source,
+        cr=True,
+        fi=0x82,
+        gi=0x80,
+        parameters=[
+            # Typical parameters we'd expect to see
+            AX25XIDClassOfProceduresParameter(half_duplex=True),
+            AX25XIDHDLCOptionalFunctionsParameter(
+                srej=True, rej=True, modulo128=True
+            ),
+            AX25XIDIFieldLengthReceiveParameter(1024),
+            AX25XIDRetriesParameter(5),
+            # Arbitrary parameters for testing
+            AX25XIDRawParameter(pi=0x12, pv=bytes([0x34, 0x56])),
+            AX25XIDRawParameter(pi=0x34, pv=None),
+        ],
+    )
@@ -4,11 +4,17 @@
 Human-readable hex strings.
 """
 
-from binascii import a2b_hex
+from functools import lru_cache
 
+# Translation table that strips whitespace from hex strings
+_WS = str.maketrans("", "", " \t\r\n")
 
+
+# The same fixtures are decoded by many tests; bytes are immutable, so the
+# result can be shared.
+@lru_cache(maxsize=None)
 def from_hex(hexstr):
-    return a2b_hex(hexstr.replace(" ", ""))
+    return bytes.fromhex(hexstr.translate(_WS))
 
 
 def to_hex(bytestr):
@@ -16,13 +22,17 @@ def to_hex(bytestr):
 
 
 def hex_cmp(bytestr1, bytestr2):
-    if not isinstance(bytestr1, bytes):
+    if isinstance(bytestr1, str):
         bytestr1 = from_hex(bytestr1)
 
-    if not isinstance(bytestr2, bytes):
+    if isinstance(bytestr2, str):
         bytestr2 = from_hex(bytestr2)
 
-    assert bytestr1 == bytestr2, (
+    if bytestr1 == bytestr2:
+        return
+
+    # Only format the diff if there's a mismatch
+    raise AssertionError(
         "Byte strings do not match:\n"
         "  1> %s\n"
         "  2> %s\n"
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 from aioax25.frame import AX25Address
-from ..hex import from_hex, to_hex
+from ..hex import from_hex, to_hex, hex_cmp
 
 
 def test_decode_wrongtype():
@@ -34,6 +34,26 @@ def test_decode_bytes():
     assert addr._callsign == "VK4MSL"
 
 
+def test_decode_memoryview():
+    """
+    Test we can decode a plain AX.25 address from a memoryview.
+    """
+    addr = AX25Address.decode(memoryview(from_hex("ac 96 68 9a a6 98 00")))
+    assert addr._callsign == "VK4MSL"
+
+
+def test_decode_bytes_not_shared():
+    """
+    Test decoding the same address twice gives independent instances.
+    """
+    a = AX25Address.decode(from_hex("ac 96 68 9a a6 98 00"))
+    b = AX25Address.decode(from_hex("ac 96 68 9a a6 98 00"))
+    assert a is not b
+
+    b.ch = True
+    assert a._ch is False
+
+
 def test_decode_bytes_spaces():
     """
     Test trailing spaces are truncated in call-signs.
@@ -90,6 +110,24 @@ def test_decode_str():
     assert addr._callsign == "VK4MSL"
 
 
+def test_decode_str_bare_ssid():
+    """
+    Test that a bare call-sign takes the SSID given separately.
+    """
+    addr = AX25Address.decode("VK4MSL", ssid=7)
+    assert addr._callsign == "VK4MSL"
+    assert addr._ssid == 7
+    assert addr._ch is False
+
+
+def test_decode_str_lowercase():
+    """
+    Test that lower-case call-signs are normalised to upper-case.
+    """
+    addr = AX25Address.decode("vk4msl")
+    assert addr._callsign == "VK4MSL"
+
+
 def test_decode_str_invalid():
     """
     Test that strings are correctly validated.
@@ -168,6 +206,16 @@ def test_encode_str_ch():
     assert str(AX25Address("VK4MSL", ch=True)) == "VK4MSL*"
 
 
+def test_encode_str_ch_setter():
+    """
+    Test mutating the C/H bit is reflected in the string form.
+    """
+    a = AX25Address("VK4MSL", 11)
+    assert str(a) == "VK4MSL-11"
+    a.ch = True
+    assert str(a) == "VK4MSL-11*"
+
+
 def test_encode_repr():
     """
     Test we can represent the AX25Address as a Python string
@@ -324,6 +372,24 @@ def test_hash():
     assert hash(a) != hash(c)
 
 
+def test_copy_plain():
+    """
+    Test we can make an identical copy of an address.
+    """
+    a = AX25Address("VK4MSL", 15, ch=True, extension=True)
+    encoded = bytes(a)
+    b = a.copy()
+
+    assert b is not a
+    assert b == a
+    assert bytes(b) == encoded
+
+    # Changes to the copy must not affect the original
+    b.ch = False
+    assert a._ch is True
+    assert bytes(a) == encoded
+
+
 def test_copy():
     """
     Test we can make copies of the address with arbitrary fields set.
@@ -378,3 +444,23 @@ def test_extension_setter():
     a = AX25Address("VK4MSL", 15, extension=False)
     a.extension = True
     assert a._extension is True
+
+
+def test_ch_setter_encode():
+    """
+    Test mutating the C/H bit is reflected in the encoded address.
+    """
+    a = AX25Address("VK4MSL", 15, ch=False)
+    hex_cmp(bytes(a), from_hex("ac 96 68 9a a6 98 7e"))
+    a.ch = True
+    hex_cmp(bytes(a), from_hex("ac 96 68 9a a6 98 fe"))
+
+
+def test_extension_setter_encode():
+    """
+    Test mutating the extension bit is reflected in the encoded address.
+    """
+    a = AX25Address("VK4MSL", 15, extension=False)
+    hex_cmp(bytes(a), from_hex("ac 96 68 9a a6 98 7e"))
+    a.extension = True
+    hex_cmp(bytes(a), from_hex("ac 96 68 9a a6 98 7f"))
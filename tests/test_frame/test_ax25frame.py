@@ -2,18 +2,15 @@
 
 from aioax25.frame import (
     AX25Frame,
+    AX25FrameHeader,
     AX25RawFrame,
     AX25UnnumberedInformationFrame,
-    AX258BitReceiveReadyFrame,
-    AX2516BitReceiveReadyFrame,
-    AX258BitRejectFrame,
-    AX2516BitRejectFrame,
-    AX258BitInformationFrame,
-    AX2516BitInformationFrame,
 )
 
 from ..hex import from_hex, hex_cmp
 
+from pytest import raises
+
 # Basic frame operations
 
 
@@ -21,16 +18,13 @@ def test_decode_incomplete():
     """
     Test that an incomplete frame does not cause a crash.
     """
-    try:
+    with raises(ValueError, match=r"^Insufficient packet data$"):
         AX25Frame.decode(
             from_hex(
                 "ac 96 68 84 ae 92 e0"  # Destination
                 "ac 96 68 9a a6 98 61"  # Source
             )
         )
-        assert False, "This should not have worked"
-    except ValueError as e:
-        assert str(e) == "Insufficient packet data"
 
 
 def test_decode_iframe():
@@ -44,7 +38,7 @@ def test_decode_iframe():
             "00 11 22 33 44 55 66 77"  # Payload
         )
     )
-    assert isinstance(frame, AX25RawFrame), "Did not decode to raw frame"
+    assert type(frame) is AX25RawFrame, "Did not decode to raw frame"
     hex_cmp(frame.frame_payload, "00 11 22 33 44 55 66 77")
 
 
@@ -59,10 +53,30 @@ def test_decode_sframe():
             "01 11 22 33 44 55 66 77"  # Payload
         )
     )
-    assert isinstance(frame, AX25RawFrame), "Did not decode to raw frame"
+    assert type(frame) is AX25RawFrame, "Did not decode to raw frame"
     hex_cmp(frame.frame_payload, "01 11 22 33 44 55 66 77")
 
 
+def test_decode_bytearray():
+    """
+    Test that a frame given as a bytearray decodes to a copy of its payload.
+    """
+    data = bytearray(
+        from_hex(
+            "ac 96 68 84 ae 92 e0"  # Destination
+            "ac 96 68 9a a6 98 61"  # Source
+            "00 11 22 33 44 55 66 77"  # Payload
+        )
+    )
+    frame = AX25Frame.decode(data)
+    assert type(frame) is AX25RawFrame, "Did not decode to raw frame"
+    assert isinstance(frame.frame_payload, bytes)
+
+    # Modifying the original buffer must not alter the decoded frame
+    data[14] = 0xFF
+    hex_cmp(frame.frame_payload, "00 11 22 33 44 55 66 77")
+
+
 def test_decode_rawframe():
     """
     Test that we can decode an AX25RawFrame.
@@ -74,7 +88,7 @@ def test_decode_rawframe():
         payload=b"\x03\xf0This is a test",
     )
     frame = AX25Frame.decode(rawframe)
-    assert isinstance(frame, AX25UnnumberedInformationFrame)
+    assert type(frame) is AX25UnnumberedInformationFrame
     assert frame.pid == 0xF0
     assert frame.payload == b"This is a test"
 
@@ -106,10 +120,10 @@ def test_frame_deadline_ro_if_set_constructor():
     frame = AX25RawFrame(
         destination="VK4BWI", source="VK4MSL", deadline=11223344
     )
-    try:
+    with raises(
+        ValueError, match=r"^Deadline may not be changed after being set$"
+    ):
         frame.deadline = 99887766
-    except ValueError as e:
-        assert str(e) == "Deadline may not be changed after being set"
 
     assert frame.deadline == 11223344
 
@@ -125,14 +139,23 @@ def test_frame_deadline_ro_if_set():
 
     frame.deadline = 44556677
 
-    try:
+    with raises(
+        ValueError, match=r"^Deadline may not be changed after being set$"
+    ):
         frame.deadline = 99887766
-    except ValueError as e:
-        assert str(e) == "Deadline may not be changed after being set"
 
     assert frame.deadline == 44556677
 
 
+def test_frame_slots():
+    """
+    Test that frames do not accept arbitrary attributes.
+    """
+    frame = AX25RawFrame(destination="VK4BWI", source="VK4MSL")
+    with raises(AttributeError):
+        frame.foo = "bar"
+
+
 def test_frame_tnc2():
     """
     Test that we can get a TNC2-compatible frame string.
@@ -143,14 +166,16 @@ def test_frame_tnc2():
     assert frame.tnc2 == "VK4MSL>VK4BWI"
 
 
-def test_encode_raw():
+def test_encode_raw(vk4_addrs):
     """
     Test that we can encode a raw frame.
     """
+    (destination, source) = vk4_addrs
+
     # Yes, this is really a UI frame.
     frame = AX25RawFrame(
-        destination="VK4BWI",
-        source="VK4MSL",
+        destination=destination,
+        source=source,
         cr=True,
         payload=b"\x03\xf0This is a test",
     )
@@ -163,12 +188,15 @@ def test_encode_raw():
     )
 
 
-def test_raw_copy():
+def test_raw_copy(vk4_addrs):
     """
     Test we can make a copy of a raw frame.
     """
+    (destination, source) = vk4_addrs
     frame = AX25RawFrame(
-        destination="VK4BWI", source="VK4MSL", payload=b"\xabThis is a test"
+        destination=destination,
+        source=source,
+        payload=b"\xabThis is a test",
     )
     framecopy = frame.copy()
     assert framecopy is not frame
@@ -182,302 +210,105 @@ def test_raw_copy():
     )
 
 
-def test_raw_str():
+def test_encode_cached(vk4_addrs):
     """
-    Test we can get a string representation of a raw frame.
+    Test the encoded payload is generated once and shared with copies.
     """
+    (destination, source) = vk4_addrs
     frame = AX25RawFrame(
-        destination="VK4BWI", source="VK4MSL", payload=b"\xabThis is a test"
-    )
-    assert str(frame) == (
-        "AX25RawFrame VK4MSL>VK4BWI:\n" "Payload=b'\\xabThis is a test'"
+        destination=destination,
+        source=source,
+        payload=b"\xabThis is a test",
     )
+    encoded = bytes(frame)
+    assert bytes(frame) == encoded
+    assert bytes(frame.copy()) == encoded
+    assert frame.copy()._encoded_payload is frame._encoded_payload
 
 
-def test_ui_str():
+def test_encode_repeater_modified():
     """
-    Test we can get a string representation of a UI frame.
+    Test that changes to the header after encoding are reflected.
     """
     frame = AX25UnnumberedInformationFrame(
         destination="VK4BWI",
         source="VK4MSL",
+        repeaters=("WIDE1-1",),
         cr=True,
         pid=0xF0,
         payload=b"This is a test",
     )
-    assert str(frame) == (
-        "AX25UnnumberedInformationFrame VK4MSL>VK4BWI: "
-        "Control=0x03 P/F=False Modifier=0x03 PID=0xf0\n"
-        "Payload=b'This is a test'"
-    )
-
-
-def test_ui_tnc2():
-    """
-    Test we can get a TNC2 string representation of a UI frame.
-    """
-    frame = AX25UnnumberedInformationFrame(
-        destination="VK4BWI*",
-        source="VK4MSL",
-        cr=True,
-        pid=0xF0,
-        payload=b"This is a test",
-    )
-    assert frame.tnc2 == "VK4MSL>VK4BWI:This is a test"
-
-
-# Supervisory frame tests
-
-
-def test_sframe_payload_reject():
-    """
-    Test payloads are forbidden for S-frames
-    """
-    try:
-        AX25Frame.decode(
-            from_hex(
-                "ac 96 68 84 ae 92 60"  # Destination
-                "ac 96 68 9a a6 98 e1"  # Source
-                "41"  # Control
-                "31 32 33 34 35"  # Payload
-            ),
-            modulo128=False,
-        )
-        assert False, "Should not have worked"
-    except ValueError as e:
-        assert str(e) == "Supervisory frames do not support payloads."
-
-
-def test_16bs_truncated_reject():
-    """
-    Test that 16-bit S-frames with truncated control fields are rejected.
-    """
-    try:
-        AX25Frame.decode(
-            from_hex(
-                "ac 96 68 84 ae 92 60"  # Destination
-                "ac 96 68 9a a6 98 e1"  # Source
-                "01"  # Control (LSB only)
-            ),
-            modulo128=True,
-        )
-        assert False, "Should not have worked"
-    except ValueError as e:
-        assert str(e) == "Insufficient packet data"
-
-
-def test_8bs_rr_frame():
-    """
-    Test we can generate a 8-bit RR supervisory frame
-    """
-    frame = AX25Frame.decode(
-        from_hex(
-            "ac 96 68 84 ae 92 60"  # Destination
-            "ac 96 68 9a a6 98 e1"  # Source
-            "41"  # Control
-        ),
-        modulo128=False,
-    )
-    assert isinstance(frame, AX258BitReceiveReadyFrame)
-    assert frame.nr == 2
-
-
-def test_16bs_rr_frame():
-    """
-    Test we can generate a 16-bit RR supervisory frame
-    """
-    frame = AX25Frame.decode(
-        from_hex(
-            "ac 96 68 84 ae 92 60"  # Destination
-            "ac 96 68 9a a6 98 e1"  # Source
-            "01 5c"  # Control
-        ),
-        modulo128=True,
-    )
-    assert isinstance(frame, AX2516BitReceiveReadyFrame)
-    assert frame.nr == 46
-
-
-def test_16bs_rr_encode():
-    """
-    Test we can encode a 16-bit RR supervisory frame
-    """
-    frame = AX2516BitReceiveReadyFrame(
-        destination="VK4BWI", source="VK4MSL", nr=46, pf=True
-    )
     hex_cmp(
         bytes(frame),
-        "ac 96 68 84 ae 92 60"  # Destination
-        "ac 96 68 9a a6 98 e1"  # Source
-        "01 5d",  # Control
-    )
-    assert frame.control == 0x5D01
-
-
-def test_8bs_rej_decode_frame():
-    """
-    Test we can decode a 8-bit REJ supervisory frame
-    """
-    frame = AX25Frame.decode(
-        from_hex(
-            "ac 96 68 84 ae 92 60"  # Destination
-            "ac 96 68 9a a6 98 e1"  # Source
-            "09"  # Control byte
-        ),
-        modulo128=False,
-    )
-    assert isinstance(
-        frame, AX258BitRejectFrame
-    ), "Did not decode to REJ frame"
-    assert frame.nr == 0
-    assert frame.pf == False
-
-
-def test_16bs_rej_decode_frame():
-    """
-    Test we can decode a 16-bit REJ supervisory frame
-    """
-    frame = AX25Frame.decode(
-        from_hex(
-            "ac 96 68 84 ae 92 60"  # Destination
-            "ac 96 68 9a a6 98 e1"  # Source
-            "09 00"  # Control bytes
-        ),
-        modulo128=True,
+        "ac 96 68 84 ae 92 e0"  # Destination
+        "ac 96 68 9a a6 98 60"  # Source
+        "ae 92 88 8a 62 40 63"  # Digi
+        "03"  # Control
+        "f0 54 68 69 73 20 69 73 20 61 20 74 65 73 74",  # Payload
     )
-    assert isinstance(
-        frame, AX2516BitRejectFrame
-    ), "Did not decode to REJ frame"
-    assert frame.nr == 0
-    assert frame.pf == False
-
 
-def test_rr_frame_str():
-    """
-    Test we can get the string representation of a RR frame.
-    """
-    frame = AX258BitReceiveReadyFrame(
-        destination="VK4BWI", source="VK4MSL", nr=6
+    # Mark the frame as repeated by the digipeater
+    frame.header.repeaters[0].ch = True
+    hex_cmp(
+        bytes(frame),
+        "ac 96 68 84 ae 92 e0"  # Destination
+        "ac 96 68 9a a6 98 60"  # Source
+        "ae 92 88 8a 62 40 e3"  # Digi
+        "03"  # Control
+        "f0 54 68 69 73 20 69 73 20 61 20 74 65 73 74",  # Payload
     )
 
-    assert str(frame) == (
-        "AX258BitReceiveReadyFrame VK4MSL>VK4BWI: N(R)=6 P/F=False "
-        "Code=0x00"
-    )
+    # Copies must pick up the change too
+    hex_cmp(bytes(frame.copy()), bytes(frame))
 
 
-def test_rr_frame_copy():
+def test_encode_cached_new_header(vk4_addrs):
     """
-    Test we can get the string representation of a RR frame.
+    Test a copy with a new header is re-encoded.
     """
-    frame = AX258BitReceiveReadyFrame(
-        destination="VK4BWI", source="VK4MSL", nr=6
+    (destination, source) = vk4_addrs
+    frame = AX25RawFrame(
+        destination=destination,
+        source=source,
+        payload=b"\xabThis is a test",
+    )
+    bytes(frame)
+    framecopy = frame.copy(
+        header=AX25FrameHeader(
+            destination=source, source=destination, cr=True
+        )
     )
-    framecopy = frame.copy()
 
-    assert framecopy is not frame
     hex_cmp(
         bytes(framecopy),
-        "ac 96 68 84 ae 92 60"  # Destination
-        "ac 96 68 9a a6 98 e1"  # Source
-        "c1",  # Control byte
-    )
-
-
-# Information frames
-
-
-def test_8bit_iframe_decode():
-    """
-    Test we can decode an 8-bit information frame.
-    """
-    frame = AX25Frame.decode(
-        from_hex(
-            "ac 96 68 84 ae 92 60"  # Destination
-            "ac 96 68 9a a6 98 e1"  # Source
-            "d4"  # Control
-            "ff"  # PID
-            "54 68 69 73 20 69 73 20 61 20 74 65 73 74"  # Payload
-        ),
-        modulo128=False,
-    )
-
-    assert isinstance(
-        frame, AX258BitInformationFrame
-    ), "Did not decode to 8-bit I-Frame"
-    assert frame.nr == 6
-    assert frame.ns == 2
-    assert frame.pid == 0xFF
-    assert frame.payload == b"This is a test"
-
-
-def test_16bit_iframe_decode():
-    """
-    Test we can decode an 16-bit information frame.
-    """
-    frame = AX25Frame.decode(
-        from_hex(
-            "ac 96 68 84 ae 92 60"  # Destination
-            "ac 96 68 9a a6 98 e1"  # Source
-            "04 0d"  # Control
-            "ff"  # PID
-            "54 68 69 73 20 69 73 20 61 20 74 65 73 74"  # Payload
-        ),
-        modulo128=True,
+        "ac 96 68 9a a6 98 e0"  # Destination
+        "ac 96 68 84 ae 92 61"  # Source
+        "ab"  # Control
+        "54 68 69 73 20 69 73 20 61 20 74 65 73 74",  # Payload
     )
 
-    assert isinstance(
-        frame, AX2516BitInformationFrame
-    ), "Did not decode to 16-bit I-Frame"
-    assert frame.nr == 6
-    assert frame.ns == 2
-    assert frame.pid == 0xFF
-    assert frame.payload == b"This is a test"
-
 
-def test_iframe_str():
+def test_raw_str():
     """
-    Test we can get the string representation of an information frame.
+    Test we can get a string representation of a raw frame.
     """
-    frame = AX258BitInformationFrame(
-        destination="VK4BWI",
-        source="VK4MSL",
-        nr=6,
-        ns=2,
-        pid=0xFF,
-        pf=True,
-        payload=b"Testing 1 2 3",
+    frame = AX25RawFrame(
+        destination="VK4BWI", source="VK4MSL", payload=b"\xabThis is a test"
     )
-
     assert str(frame) == (
-        "AX258BitInformationFrame VK4MSL>VK4BWI: "
-        "N(R)=6 P/F=True N(S)=2 PID=0xff\n"
-        "Payload=b'Testing 1 2 3'"
+        "AX25RawFrame VK4MSL>VK4BWI:\n" "Payload=b'\\xabThis is a test'"
     )
 
 
-def test_iframe_copy():
+def test_ui_tnc2():
     """
-    Test we can get the string representation of an information frame.
+    Test we can get a TNC2 string representation of a UI frame.
     """
-    frame = AX258BitInformationFrame(
-        destination="VK4BWI",
+    frame = AX25UnnumberedInformationFrame(
+        destination="VK4BWI*",
         source="VK4MSL",
-        nr=6,
-        ns=2,
-        pid=0xFF,
-        pf=True,
-        payload=b"Testing 1 2 3",
-    )
-    framecopy = frame.copy()
-
-    assert framecopy is not frame
-    hex_cmp(
-        bytes(framecopy),
-        "ac 96 68 84 ae 92 60"  # Destination
-        "ac 96 68 9a a6 98 e1"  # Source
-        "d4"  # Control byte
-        "ff"  # PID
-        "54 65 73 74 69 6e 67 20"
-        "31 20 32 20 33",  # Payload
+        cr=True,
+        pid=0xF0,
+        payload=b"This is a test",
     )
+    assert frame.tnc2 == "VK4MSL>VK4BWI:This is a test"
@@ -3,18 +3,31 @@
 from aioax25.frame import AX25Address, AX25FrameHeader
 from ..hex import from_hex, hex_cmp
 
+from pytest import raises
+
 
 def test_decode_incomplete():
     """
     Test that an incomplete frame does not cause a crash.
     """
-    try:
+    with raises(ValueError, match=r"^Too few addresses$"):
         AX25FrameHeader.decode(
             from_hex("ac 96 68 84 ae 92 e0")  # Destination
         )
-        assert False, "This should not have worked"
-    except ValueError as e:
-        assert str(e) == "Too few addresses"
+
+
+def test_decode_truncated_digi():
+    """
+    Test that a truncated digipeater address is rejected.
+    """
+    with raises(ValueError, match=r"^AX\.25 addresses must be 7 bytes!$"):
+        AX25FrameHeader.decode(
+            from_hex(
+                "ac 96 68 84 ae 92 e0"  # Destination
+                "ac 96 68 9a a6 98 60"  # Source
+                "ac 96 68 a4 b4"  # Digi (truncated)
+            )
+        )
 
 
 def test_decode_no_digis():
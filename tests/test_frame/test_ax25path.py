@@ -3,11 +3,11 @@
 from aioax25.frame import AX25Address, AX25Path
 
 
-def test_decode():
+def test_decode(vk4_path):
     """
     Test given a list of strings, AX25Path decodes them.
     """
-    path = AX25Path("VK4MSL", "VK4RZB", "VK4RZA")
+    path = vk4_path
     assert path._path[0]._callsign == "VK4MSL"
     assert path._path[1]._callsign == "VK4RZB"
     assert path._path[2]._callsign == "VK4RZA"
@@ -27,19 +27,19 @@ def test_addresses():
     assert path._path[2]._callsign == "VK4RZA"
 
 
-def test_str():
+def test_str(vk4_path):
     """
     Test we can return the canonical format for a repeater path.
     """
-    path = AX25Path("VK4MSL", "VK4RZB", "VK4RZA")
+    path = vk4_path
     assert str(path) == "VK4MSL,VK4RZB,VK4RZA"
 
 
-def test_repr():
+def test_repr(vk4_path):
     """
     Test we can return the Python representation for a repeater path.
     """
-    path = AX25Path("VK4MSL", "VK4RZB", "VK4RZA")
+    path = vk4_path
     assert repr(path) == (
         "AX25Path("
         "AX25Address("
@@ -83,3 +83,12 @@ def test_replace():
     path1 = AX25Path("WIDE2-2", "WIDE1-1")
     path2 = path1.replace("WIDE2-2", "VK4MSL*")
     assert str(path2) == "VK4MSL*,WIDE1-1"
+
+
+def test_replace_normalised():
+    """
+    Test the alias is matched regardless of the C/H bit.
+    """
+    path1 = AX25Path("VK4RZB*", "WIDE2-2", "WIDE2")
+    path2 = path1.replace("VK4RZB", "VK4MSL*")
+    assert str(path2) == "VK4MSL*,WIDE2-2,WIDE2"
@@ -24,8 +24,8 @@ def test_8bit_iframe_decode():
         modulo128=False,
     )
 
-    assert isinstance(
-        frame, AX258BitInformationFrame
+    assert (
+        type(frame) is AX258BitInformationFrame
     ), "Did not decode to 8-bit I-Frame"
     assert frame.nr == 6
     assert frame.ns == 2
@@ -48,8 +48,8 @@ def test_16bit_iframe_decode():
         modulo128=True,
     )
 
-    assert isinstance(
-        frame, AX2516BitInformationFrame
+    assert (
+        type(frame) is AX2516BitInformationFrame
     ), "Did not decode to 16-bit I-Frame"
     assert frame.nr == 6
     assert frame.ns == 2
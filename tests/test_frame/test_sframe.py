@@ -10,12 +10,16 @@ from aioax25.frame import (
 
 from ..hex import from_hex, hex_cmp
 
+from pytest import raises
+
 
 def test_sframe_payload_reject():
     """
     Test payloads are forbidden for S-frames
     """
-    try:
+    with raises(
+        ValueError, match=r"^Supervisory frames do not support payloads\.$"
+    ):
         AX25Frame.decode(
             from_hex(
                 "ac 96 68 84 ae 92 60"  # Destination
@@ -25,16 +29,13 @@ def test_sframe_payload_reject():
             ),
             modulo128=False,
         )
-        assert False, "Should not have worked"
-    except ValueError as e:
-        assert str(e) == "Supervisory frames do not support payloads."
 
 
 def test_16bs_truncated_reject():
     """
     Test that 16-bit S-frames with truncated control fields are rejected.
     """
-    try:
+    with raises(ValueError, match=r"^Insufficient packet data$"):
         AX25Frame.decode(
             from_hex(
                 "ac 96 68 84 ae 92 60"  # Destination
@@ -43,9 +44,6 @@ def test_16bs_truncated_reject():
             ),
             modulo128=True,
         )
-        assert False, "Should not have worked"
-    except ValueError as e:
-        assert str(e) == "Insufficient packet data"
 
 
 def test_8bs_rr_frame():
@@ -60,7 +58,7 @@ def test_8bs_rr_frame():
         ),
         modulo128=False,
     )
-    assert isinstance(frame, AX258BitReceiveReadyFrame)
+    assert type(frame) is AX258BitReceiveReadyFrame
     assert frame.nr == 2
 
 
@@ -76,7 +74,7 @@ def test_16bs_rr_frame():
         ),
         modulo128=True,
     )
-    assert isinstance(frame, AX2516BitReceiveReadyFrame)
+    assert type(frame) is AX2516BitReceiveReadyFrame
     assert frame.nr == 46
 
 
@@ -108,9 +106,7 @@ def test_8bs_rej_decode_frame():
         ),
         modulo128=False,
     )
-    assert isinstance(
-        frame, AX258BitRejectFrame
-    ), "Did not decode to REJ frame"
+    assert type(frame) is AX258BitRejectFrame, "Did not decode to REJ frame"
     assert frame.nr == 0
     assert frame.pf == False
 
@@ -127,9 +123,7 @@ def test_16bs_rej_decode_frame():
         ),
         modulo128=True,
     )
-    assert isinstance(
-        frame, AX2516BitRejectFrame
-    ), "Did not decode to REJ frame"
+    assert type(frame) is AX2516BitRejectFrame, "Did not decode to REJ frame"
     assert frame.nr == 0
     assert frame.pf == False
 
@@ -14,6 +14,8 @@ from aioax25.frame import (
 
 from ..hex import from_hex, hex_cmp
 
+from pytest import mark, raises
+
 
 def test_decode_uframe():
     """
@@ -26,8 +28,8 @@ def test_decode_uframe():
             "c3"  # Control byte
         )
     )
-    assert isinstance(
-        frame, AX25UnnumberedFrame
+    assert (
+        type(frame) is AX25UnnumberedFrame
     ), "Did not decode to unnumbered frame"
     assert frame.modifier == 0xC3
 
@@ -46,8 +48,8 @@ def test_decode_sabm():
             "3f"  # Control byte
         )
     )
-    assert isinstance(
-        frame, AX25SetAsyncBalancedModeFrame
+    assert (
+        type(frame) is AX25SetAsyncBalancedModeFrame
     ), "Did not decode to SABM frame"
 
 
@@ -55,7 +57,7 @@ def test_decode_sabm_payload():
     """
     Test that a SABM frame forbids payload.
     """
-    try:
+    with raises(ValueError, match=r"^Frame does not support payload"):
         AX25Frame.decode(
             from_hex(
                 "ac 96 68 84 ae 92 e0"  # Destination
@@ -64,9 +66,6 @@ def test_decode_sabm_payload():
                 "11 22 33 44 55"  # Payload
             )
         )
-        assert False, "This should not have worked"
-    except ValueError as e:
-        assert str(e).startswith("Frame does not support payload")
 
 
 def test_decode_sabme():
@@ -80,8 +79,8 @@ def test_decode_sabme():
             "7f"  # Control byte
         )
     )
-    assert isinstance(
-        frame, AX25SetAsyncBalancedModeExtendedFrame
+    assert (
+        type(frame) is AX25SetAsyncBalancedModeExtendedFrame
     ), "Did not decode to SABME frame"
 
 
@@ -89,7 +88,7 @@ def test_decode_sabme_payload():
     """
     Test that a SABME frame forbids payload.
     """
-    try:
+    with raises(ValueError, match=r"^Frame does not support payload"):
         AX25Frame.decode(
             from_hex(
                 "ac 96 68 84 ae 92 e0"  # Destination
@@ -98,16 +97,17 @@ def test_decode_sabme_payload():
                 "11 22 33 44 55"  # Payload
             )
         )
-        assert False, "This should not have worked"
-    except ValueError as e:
-        assert str(e).startswith("Frame does not support payload")
 
 
 def test_decode_uframe_payload():
     """
     Test that U-frames other than FRMR and UI are forbidden to have payloads.
     """
-    try:
+    with raises(
+        ValueError,
+        match=r"^Unnumbered frames \(other than UI and "
+        r"FRMR\) do not have payloads$",
+    ):
         AX25Frame.decode(
             from_hex(
                 "ac 96 68 84 ae 92 e0"  # Destination
@@ -115,12 +115,6 @@ def test_decode_uframe_payload():
                 "c3 11 22 33"  # Control byte
             )
         )
-        assert False, "Should not have worked"
-    except ValueError as e:
-        assert str(e) == (
-            "Unnumbered frames (other than UI and "
-            "FRMR) do not have payloads"
-        )
 
 
 def test_decode_frmr():
@@ -135,9 +129,7 @@ def test_decode_frmr():
             "11 22 33"  # Payload
         )
     )
-    assert isinstance(
-        frame, AX25FrameRejectFrame
-    ), "Did not decode to FRMR frame"
+    assert type(frame) is AX25FrameRejectFrame, "Did not decode to FRMR frame"
     assert frame.modifier == 0x87
     assert frame.w == True
     assert frame.x == False
@@ -152,7 +144,7 @@ def test_decode_frmr_len():
     """
     Test that a FRMR must have 3 byte payload.
     """
-    try:
+    with raises(ValueError, match=r"^Payload of FRMR must be 3 bytes$"):
         AX25Frame.decode(
             from_hex(
                 "ac 96 68 84 ae 92 e0"  # Destination
@@ -161,9 +153,6 @@ def test_decode_frmr_len():
                 "11 22"  # Payload
             )
         )
-        assert False, "Should not have worked"
-    except ValueError as e:
-        assert str(e) == "Payload of FRMR must be 3 bytes"
 
 
 def test_decode_ui():
@@ -177,8 +166,8 @@ def test_decode_ui():
             "03 11 22 33"  # Control byte
         )
     )
-    assert isinstance(
-        frame, AX25UnnumberedInformationFrame
+    assert (
+        type(frame) is AX25UnnumberedInformationFrame
     ), "Did not decode to UI frame"
     assert frame.pid == 0x11
     hex_cmp(frame.payload, "22 33")
@@ -188,7 +177,9 @@ def test_decode_ui_len():
     """
     Test that a UI must have at least one byte payload.
     """
-    try:
+    with raises(
+        ValueError, match=r"^Payload of UI must be at least one byte$"
+    ):
         AX25Frame.decode(
             from_hex(
                 "ac 96 68 84 ae 92 e0"  # Destination
@@ -196,9 +187,6 @@ def test_decode_ui_len():
                 "03"  # Control byte
             )
         )
-        assert False, "Should not have worked"
-    except ValueError as e:
-        assert str(e) == "Payload of UI must be at least one byte"
 
 
 def test_encode_uframe():
@@ -296,7 +284,7 @@ def test_decode_test():
             "31 32 33 34 35 36 37 38 39 2e 2e 2e"  # Payload
         )
     )
-    assert isinstance(frame, AX25TestFrame)
+    assert type(frame) is AX25TestFrame
     assert frame.payload == b"123456789..."
 
 
@@ -374,111 +362,72 @@ def test_encode_sabme():
     )
 
 
-def test_encode_frmr_w():
-    """
-    Test we can set the W bit on a FRMR frame.
-    """
-    frame = AX25FrameRejectFrame(
-        destination="VK4BWI",
-        source="VK4MSL",
-        w=True,
-        x=False,
-        y=False,
-        z=False,
-        vr=0,
-        vs=0,
-        frmr_control=0,
-        frmr_cr=False,
-    )
-    hex_cmp(
-        bytes(frame),
-        "ac 96 68 84 ae 92 60"  # Destination
-        "ac 96 68 9a a6 98 e1"  # Source
-        "87"  # Control
-        "01 00 00",  # FRMR data
-    )
-
-
-def test_encode_frmr_x():
-    """
-    Test we can set the X bit on a FRMR frame.
-    """
-    frame = AX25FrameRejectFrame(
-        destination="VK4BWI",
-        source="VK4MSL",
-        w=False,
-        x=True,
-        y=False,
-        z=False,
-        vr=0,
-        vs=0,
-        frmr_control=0,
-        frmr_cr=False,
-    )
-    hex_cmp(
-        bytes(frame),
-        "ac 96 68 84 ae 92 60"  # Destination
-        "ac 96 68 9a a6 98 e1"  # Source
-        "87"  # Control
-        "02 00 00",  # FRMR data
-    )
-
-
-def test_encode_frmr_y():
-    """
-    Test we can set the Y bit on a FRMR frame.
-    """
-    frame = AX25FrameRejectFrame(
-        destination="VK4BWI",
-        source="VK4MSL",
-        w=False,
-        x=False,
-        y=True,
-        z=False,
-        vr=0,
-        vs=0,
-        frmr_control=0,
-        frmr_cr=False,
-    )
-    hex_cmp(
-        bytes(frame),
-        "ac 96 68 84 ae 92 60"  # Destination
-        "ac 96 68 9a a6 98 e1"  # Source
-        "87"  # Control
-        "04 00 00",  # FRMR data
-    )
-
-
-def test_encode_frmr_z():
-    """
-    Test we can set the Z bit on a FRMR frame.
-    """
-    frame = AX25FrameRejectFrame(
-        destination="VK4BWI",
-        source="VK4MSL",
-        w=False,
-        x=False,
-        y=False,
-        z=True,
-        vr=0,
-        vs=0,
-        frmr_control=0,
-        frmr_cr=False,
-    )
-    hex_cmp(
-        bytes(frame),
-        "ac 96 68 84 ae 92 60"  # Destination
-        "ac 96 68 9a a6 98 e1"  # Source
-        "87"  # Control
-        "08 00 00",  # FRMR data
-    )
-
-
-def test_encode_frmr_cr():
+@mark.parametrize(
+    "field, expected",
+    [
+        (
+            dict(w=True),
+            "ac 96 68 84 ae 92 60"  # Destination
+            "ac 96 68 9a a6 98 e1"  # Source
+            "87"  # Control
+            "01 00 00",  # FRMR data
+        ),
+        (
+            dict(x=True),
+            "ac 96 68 84 ae 92 60"  # Destination
+            "ac 96 68 9a a6 98 e1"  # Source
+            "87"  # Control
+            "02 00 00",  # FRMR data
+        ),
+        (
+            dict(y=True),
+            "ac 96 68 84 ae 92 60"  # Destination
+            "ac 96 68 9a a6 98 e1"  # Source
+            "87"  # Control
+            "04 00 00",  # FRMR data
+        ),
+        (
+            dict(z=True),
+            "ac 96 68 84 ae 92 60"  # Destination
+            "ac 96 68 9a a6 98 e1"  # Source
+            "87"  # Control
+            "08 00 00",  # FRMR data
+        ),
+        (
+            dict(frmr_cr=True),
+            "ac 96 68 84 ae 92 60"  # Destination
+            "ac 96 68 9a a6 98 e1"  # Source
+            "87"  # Control
+            "00 10 00",  # FRMR data
+        ),
+        (
+            dict(vr=5),
+            "ac 96 68 84 ae 92 60"  # Destination
+            "ac 96 68 9a a6 98 e1"  # Source
+            "87"  # Control
+            "00 a0 00",  # FRMR data
+        ),
+        (
+            dict(vs=5),
+            "ac 96 68 84 ae 92 60"  # Destination
+            "ac 96 68 9a a6 98 e1"  # Source
+            "87"  # Control
+            "00 0a 00",  # FRMR data
+        ),
+        (
+            dict(frmr_control=0x55),
+            "ac 96 68 84 ae 92 60"  # Destination
+            "ac 96 68 9a a6 98 e1"  # Source
+            "87"  # Control
+            "00 00 55",  # FRMR data
+        ),
+    ],
+)
+def test_encode_frmr_field(field, expected):
     """
-    Test we can set the CR bit on a FRMR frame.
+    Test we can set each of the fields on a FRMR frame.
     """
-    frame = AX25FrameRejectFrame(
+    kwargs = dict(
         destination="VK4BWI",
         source="VK4MSL",
         w=False,
@@ -488,70 +437,17 @@ def test_encode_frmr_cr():
         vr=0,
         vs=0,
         frmr_control=0,
-        frmr_cr=True,
-    )
-    hex_cmp(
-        bytes(frame),
-        "ac 96 68 84 ae 92 60"  # Destination
-        "ac 96 68 9a a6 98 e1"  # Source
-        "87"  # Control
-        "00 10 00",  # FRMR data
-    )
-
-
-def test_encode_frmr_vr():
-    """
-    Test we can set the V(R) field on a FRMR frame.
-    """
-    frame = AX25FrameRejectFrame(
-        destination="VK4BWI",
-        source="VK4MSL",
-        w=False,
-        x=False,
-        y=False,
-        z=False,
-        vr=5,
-        vs=0,
-        frmr_control=0,
-        frmr_cr=False,
-    )
-    hex_cmp(
-        bytes(frame),
-        "ac 96 68 84 ae 92 60"  # Destination
-        "ac 96 68 9a a6 98 e1"  # Source
-        "87"  # Control
-        "00 a0 00",  # FRMR data
-    )
-
-
-def test_encode_frmr_vs():
-    """
-    Test we can set the V(S) field on a FRMR frame.
-    """
-    frame = AX25FrameRejectFrame(
-        destination="VK4BWI",
-        source="VK4MSL",
-        w=False,
-        x=False,
-        y=False,
-        z=False,
-        vr=0,
-        vs=5,
-        frmr_control=0,
         frmr_cr=False,
     )
-    hex_cmp(
-        bytes(frame),
-        "ac 96 68 84 ae 92 60"  # Destination
-        "ac 96 68 9a a6 98 e1"  # Source
-        "87"  # Control
-        "00 0a 00",  # FRMR data
-    )
+    kwargs.update(field)
+    frame = AX25FrameRejectFrame(**kwargs)
+    hex_cmp(bytes(frame), expected)
 
 
-def test_encode_frmr_frmr_ctrl():
+@mark.parametrize("frmr_control", [-1, 0x100])
+def test_encode_frmr_control_range(frmr_control):
     """
-    Test we can set the FRMR Control field on a FRMR frame.
+    Test a FRMR control field that does not fit in a byte is rejected.
     """
     frame = AX25FrameRejectFrame(
         destination="VK4BWI",
@@ -562,16 +458,11 @@ def test_encode_frmr_frmr_ctrl():
         z=False,
         vr=0,
         vs=0,
-        frmr_control=0x55,
+        frmr_control=frmr_control,
         frmr_cr=False,
     )
-    hex_cmp(
-        bytes(frame),
-        "ac 96 68 84 ae 92 60"  # Destination
-        "ac 96 68 9a a6 98 e1"  # Source
-        "87"  # Control
-        "00 00 55",  # FRMR data
-    )
+    with raises(ValueError, match=r"^frmr_control must be in range"):
+        bytes(frame)
 
 
 def test_encode_dm_frame():
@@ -3,44 +3,25 @@
 from aioax25.frame import (
     AX25Frame,
     AX25ExchangeIdentificationFrame,
+    AX25XIDParameter,
     AX25XIDRawParameter,
     AX25XIDParameterIdentifier,
     AX25XIDClassOfProceduresParameter,
     AX25XIDHDLCOptionalFunctionsParameter,
-    AX25XIDIFieldLengthReceiveParameter,
     AX25XIDRetriesParameter,
 )
 
 from ..hex import from_hex, hex_cmp
 
-from pytest import mark
+from pytest import mark, raises
 
 
-def test_encode_xid():
+def test_encode_xid(xid_frame):
     """
     Test that we can encode a XID frame.
     """
-    frame = AX25ExchangeIdentificationFrame(
-        destination="VK4BWI",
-        source="VK4MSL",
-        cr=True,
-        fi=0x82,
-        gi=0x80,
-        parameters=[
-            # Typical parameters we'd expect to see
-            AX25XIDClassOfProceduresParameter(half_duplex=True),
-            AX25XIDHDLCOptionalFunctionsParameter(
-                srej=True, rej=True, modulo128=True
-            ),
-            AX25XIDIFieldLengthReceiveParameter(1024),
-            AX25XIDRetriesParameter(5),
-            # Arbitrary parameters for testing
-            AX25XIDRawParameter(pi=0x12, pv=bytes([0x34, 0x56])),
-            AX25XIDRawParameter(pi=0x34, pv=None),
-        ],
-    )
     hex_cmp(
-        bytes(frame),
+        bytes(xid_frame),
         "ac 96 68 84 ae 92 e0"  # Destination
         "ac 96 68 9a a6 98 61"  # Source
         "af"  # Control
@@ -85,7 +66,7 @@ def test_decode_xid():
             "14 00"
         )
     )
-    assert isinstance(frame, AX25ExchangeIdentificationFrame)
+    assert type(frame) is AX25ExchangeIdentificationFrame
     assert frame.fi == 0x82
     assert frame.gi == 0x80
     assert len(frame.parameters) == 4
@@ -158,7 +139,7 @@ def test_decode_xid_truncated_header():
     """
     Test that decoding a XID with truncated header fails.
     """
-    try:
+    with raises(ValueError, match=r"^Truncated XID header$"):
         AX25Frame.decode(
             from_hex(
                 "ac 96 68 84 ae 92 e0"  # Destination
@@ -169,16 +150,13 @@ def test_decode_xid_truncated_header():
                 "00"  # Incomplete GL
             )
         )
-        assert False, "This should not have worked"
-    except ValueError as e:
-        assert str(e) == "Truncated XID header"
 
 
 def test_decode_xid_truncated_payload():
     """
     Test that decoding a XID with truncated payload fails.
     """
-    try:
+    with raises(ValueError, match=r"^Truncated XID data$"):
         AX25Frame.decode(
             from_hex(
                 "ac 96 68 84 ae 92 e0"  # Destination
@@ -190,16 +168,13 @@ def test_decode_xid_truncated_payload():
                 "11"  # Incomplete payload
             )
         )
-        assert False, "This should not have worked"
-    except ValueError as e:
-        assert str(e) == "Truncated XID data"
 
 
 def test_decode_xid_truncated_param_header():
     """
     Test that decoding a XID with truncated parameter header fails.
     """
-    try:
+    with raises(ValueError, match=r"^Insufficient data for parameter$"):
         AX25Frame.decode(
             from_hex(
                 "ac 96 68 84 ae 92 e0"  # Destination
@@ -211,16 +186,13 @@ def test_decode_xid_truncated_param_header():
                 "11"  # Incomplete payload
             )
         )
-        assert False, "This should not have worked"
-    except ValueError as e:
-        assert str(e) == "Insufficient data for parameter"
 
 
 def test_decode_xid_truncated_param_value():
     """
     Test that decoding a XID with truncated parameter value fails.
     """
-    try:
+    with raises(ValueError, match=r"^Parameter is truncated$"):
         AX25Frame.decode(
             from_hex(
                 "ac 96 68 84 ae 92 e0"  # Destination
@@ -232,9 +204,51 @@ def test_decode_xid_truncated_param_value():
                 "11 06 22 33"  # Incomplete payload
             )
         )
-        assert False, "This should not have worked"
-    except ValueError as e:
-        assert str(e) == "Parameter is truncated"
+
+
+def test_decode_param_remainder():
+    """
+    Test that decoding a single XID parameter returns the data following it.
+    """
+    (param, data) = AX25XIDParameter.decode(from_hex("11 02 22 33 44 55"))
+    assert type(param) is AX25XIDRawParameter
+    assert param.pi == 0x11
+    hex_cmp(param.pv, "22 33")
+    hex_cmp(data, "44 55")
+
+
+def test_raw_param_pi():
+    """
+    Test that known PIs are mapped to their identifier, unknown ones kept.
+    """
+    param = AX25XIDRawParameter(pi=0x0A, pv=b"\x05")
+    assert param.pi is AX25XIDParameterIdentifier.Retries
+
+    param = AX25XIDRawParameter(
+        pi=AX25XIDParameterIdentifier.Retries, pv=None
+    )
+    assert param.pi is AX25XIDParameterIdentifier.Retries
+
+    param = AX25XIDRawParameter(pi=0x34, pv=None)
+    assert param.pi == 0x34
+
+
+def test_decode_param_rejected(monkeypatch):
+    """
+    Test that a known parameter that fails to decode is returned raw.
+    """
+
+    def _decode(cls, pv):
+        raise ValueError("Rejected")
+
+    monkeypatch.setattr(
+        AX25XIDRetriesParameter, "decode", classmethod(_decode)
+    )
+    (param, data) = AX25XIDParameter.decode(from_hex("0a 01 05"))
+    assert type(param) is AX25XIDRawParameter
+    assert param.pi == AX25XIDParameterIdentifier.Retries
+    hex_cmp(param.pv, "05")
+    assert data == b""
 
 
 def test_copy_xid():
@@ -271,6 +285,40 @@ def test_copy_xid():
     )
 
 
+def test_copy_xid_params(xid_frame):
+    """
+    Test that copying a XID frame copies each of its parameters.
+    """
+    framecopy = xid_frame.copy()
+    assert framecopy is not xid_frame
+    assert framecopy.parameters is not xid_frame.parameters
+    for (param, copyparam) in zip(xid_frame.parameters, framecopy.parameters):
+        assert copyparam is not param
+        assert bytes(copyparam) == bytes(param)
+
+    hex_cmp(
+        bytes(framecopy),
+        "ac 96 68 84 ae 92 e0"  # Destination
+        "ac 96 68 9a a6 98 61"  # Source
+        "af"  # Control
+        "82"  # Format indicator
+        "80"  # Group Ident
+        "00 16"  # Group length
+        # First parameter: CoP
+        "02" "02" "00 21"
+        # Second parameter: HDLC Optional Functions
+        "03" "03" "86 a8 02"
+        # Third parameter: I field receive size
+        "06" "02" "04 00"
+        # Fourth parameter: retries
+        "0a" "01" "05"
+        # Fifth parameter: custom
+        "12" "02" "34 56"
+        # Sixth parameter: custom, no length set
+        "34" "00",
+    )
+
+
 def test_decode_cop_param():
     """
     Test we can decode a Class Of Procedures parameter.
@@ -308,6 +356,16 @@ def test_copy_cop_param():
     assert param.reserved == copyparam.reserved
 
 
+def test_copy_cop_param_balanced_abm():
+    """
+    Test copying a Class Of Procedures parameter preserves balanced_abm.
+    """
+    param = AX25XIDClassOfProceduresParameter(balanced_abm=False)
+    copyparam = param.copy()
+    assert copyparam.balanced_abm is False
+    assert copyparam.pv == param.pv
+
+
 def test_encode_cop_param():
     """
     Test we can encode a Class Of Procedures parameter.
@@ -426,11 +484,8 @@ def test_encode_badtype(value):
     """
     Test that AX25XIDBigEndianParameter refuses bad input types.
     """
-    try:
+    with raises(TypeError, match=r"^value must be an integer or boolean$"):
         AX25XIDRetriesParameter(value)
-        assert False, "Should not have been accepted"
-    except TypeError as e:
-        assert str(e) == "value must be an integer or boolean"
 
 
 def test_encode_retries_param():
@@ -460,3 +515,20 @@ def test_copy_retries_param():
 
     # Ensure all parameters match
     assert param.value == copyparam.value
+
+
+@mark.parametrize(
+    "param",
+    [
+        AX25XIDRawParameter(pi=0x12, pv=b"\x34"),
+        AX25XIDClassOfProceduresParameter(),
+        AX25XIDHDLCOptionalFunctionsParameter(),
+        AX25XIDRetriesParameter(10),
+    ],
+)
+def test_param_slots(param):
+    """
+    Test that XID parameters do not accept arbitrary attributes.
+    """
+    with raises(AttributeError):
+        param.foo = "bar"
@@ -5,7 +5,7 @@ from aioax25.interface import AX25Interface
 from aioax25.frame import AX25UnnumberedInformationFrame
 
 from ..asynctest import asynctest
-from asyncio import Future, get_event_loop, sleep
+from asyncio import Future, TimeoutError, sleep, wait_for
 
 import time
 import re
@@ -36,34 +36,47 @@ class UnreliableDummyKISS(DummyKISS):
         super(UnreliableDummyKISS, self).send(frame)
 
 
+async def wait_transmit(transmit_future, timeout=1.0):
+    """
+    Wait for a frame to be transmitted, failing the test if it isn't.
+    """
+    try:
+        await wait_for(transmit_future, timeout=timeout)
+    except TimeoutError:
+        raise AssertionError(
+            "Frame not transmitted within %s seconds" % timeout
+        )
+
+
 @asynctest
 async def test_received_msg_signal():
     """
     Test received messages trigger the received_msg signal.
     """
     my_port = DummyKISS()
+    received = []
     my_frame = AX25UnnumberedInformationFrame(
         destination="VK4BWI", source="VK4MSL", pid=0xF0, payload=b"testing"
     )
-    receive_future = Future()
 
     my_interface = AX25Interface(my_port)
 
-    def _on_receive_match(interface, frame, **kwargs):
-        try:
-            assert len(kwargs) == 0, "Too many arguments"
-            assert (interface) is (my_interface), "Wrong interface"
-            assert bytes(frame) == bytes(my_frame), "Wrong frame"
-            receive_future.set_result(None)
-        except Exception as e:
-            receive_future.set_exception(e)
+    def _on_receive_match(**kwargs):
+        received.append(kwargs)
 
     my_interface.received_msg.connect(_on_receive_match)
 
     # Pass in a message
     my_port.received.emit(frame=bytes(my_frame))
 
-    await receive_future
+    # Receivers are called on the next pass of the event loop
+    await sleep(0)
+
+    assert len(received) == 1, "Receiver not called"
+    kwargs = received.pop(0)
+    assert kwargs.pop("interface") is my_interface, "Wrong interface"
+    assert bytes(kwargs.pop("frame")) == bytes(my_frame), "Wrong frame"
+    assert len(kwargs) == 0, "Too many arguments"
 
 
 def test_receive_bind():
@@ -92,42 +105,37 @@ async def test_receive_str_filter():
     Test matching messages can trigger string filters (without SSID).
     """
     my_port = DummyKISS()
+    received = []
     unmatched_filter_received = []
     my_frame = AX25UnnumberedInformationFrame(
         destination="VK4BWI-4", source="VK4MSL", pid=0xF0, payload=b"testing"
     )
-    receive_future = Future()
 
     my_interface = AX25Interface(my_port)
 
-    def _on_receive_match(interface, frame, **kwargs):
-        try:
-            assert len(kwargs) == 0, "Too many arguments"
-            assert (interface) is (my_interface), "Wrong interface"
-            assert bytes(frame) == bytes(my_frame), "Wrong frame"
-            receive_future.set_result(None)
-        except Exception as e:
-            receive_future.set_exception(e)
+    def _on_receive_match(**kwargs):
+        received.append(kwargs)
 
     def _on_receive_nomatch(**kwargs):
         unmatched_filter_received.append(kwargs)
 
-    def _on_timeout():
-        receive_future.set_exception(AssertionError("Timed out"))
-
     # This should match
     my_interface.bind(_on_receive_match, "VK4BWI", ssid=None)
 
     # This should not match
     my_interface.bind(_on_receive_nomatch, "VK4AWI", ssid=None)
 
-    # Set a timeout
-    get_event_loop().call_later(1.0, _on_timeout)
-
     # Pass in a message
     my_port.received.emit(frame=bytes(my_frame))
 
-    await receive_future
+    # Receivers are called on the next pass of the event loop
+    await sleep(0)
+
+    assert len(received) == 1, "Receiver not called"
+    kwargs = received.pop(0)
+    assert kwargs.pop("interface") is my_interface, "Wrong interface"
+    assert bytes(kwargs.pop("frame")) == bytes(my_frame), "Wrong frame"
+    assert len(kwargs) == 0, "Too many arguments"
     assert len(unmatched_filter_received) == 0
 
 
@@ -137,42 +145,37 @@ async def test_receive_str_filter_ssid():
     Test matching messages can trigger string filters (with SSID).
     """
     my_port = DummyKISS()
+    received = []
     unmatched_filter_received = []
     my_frame = AX25UnnumberedInformationFrame(
         destination="VK4BWI-4", source="VK4MSL", pid=0xF0, payload=b"testing"
     )
-    receive_future = Future()
 
     my_interface = AX25Interface(my_port)
 
-    def _on_receive_match(interface, frame, **kwargs):
-        try:
-            assert len(kwargs) == 0, "Too many arguments"
-            assert (interface) is (my_interface), "Wrong interface"
-            assert bytes(frame) == bytes(my_frame), "Wrong frame"
-            receive_future.set_result(None)
-        except Exception as e:
-            receive_future.set_exception(e)
+    def _on_receive_match(**kwargs):
+        received.append(kwargs)
 
     def _on_receive_nomatch(**kwargs):
         unmatched_filter_received.append(kwargs)
 
-    def _on_timeout():
-        receive_future.set_exception(AssertionError("Timed out"))
-
     # This should match
     my_interface.bind(_on_receive_match, "VK4BWI", ssid=4)
 
     # This should not match
     my_interface.bind(_on_receive_nomatch, "VK4BWI", ssid=3)
 
-    # Set a timeout
-    get_event_loop().call_later(1.0, _on_timeout)
-
     # Pass in a message
     my_port.received.emit(frame=bytes(my_frame))
 
-    await receive_future
+    # Receivers are called on the next pass of the event loop
+    await sleep(0)
+
+    assert len(received) == 1, "Receiver not called"
+    kwargs = received.pop(0)
+    assert kwargs.pop("interface") is my_interface, "Wrong interface"
+    assert bytes(kwargs.pop("frame")) == bytes(my_frame), "Wrong frame"
+    assert len(kwargs) == 0, "Too many arguments"
     assert len(unmatched_filter_received) == 0
 
 
@@ -182,29 +185,20 @@ async def test_receive_re_filter():
     Test matching messages can trigger regex filters (without SSID).
     """
     my_port = DummyKISS()
+    received = []
     unmatched_filter_received = []
     my_frame = AX25UnnumberedInformationFrame(
         destination="VK4BWI-4", source="VK4MSL", pid=0xF0, payload=b"testing"
     )
-    receive_future = Future()
 
     my_interface = AX25Interface(my_port)
 
-    def _on_receive_match(interface, frame, match, **kwargs):
-        try:
-            assert len(kwargs) == 0, "Too many arguments"
-            assert (interface) is (my_interface), "Wrong interface"
-            assert bytes(frame) == bytes(my_frame), "Wrong frame"
-            receive_future.set_result(None)
-        except Exception as e:
-            receive_future.set_exception(e)
+    def _on_receive_match(**kwargs):
+        received.append(kwargs)
 
     def _on_receive_nomatch(**kwargs):
         unmatched_filter_received.append(kwargs)
 
-    def _on_timeout():
-        receive_future.set_exception(AssertionError("Timed out"))
-
     # This should match
     my_interface.bind(
         _on_receive_match, r"^VK4[BR]WI$", ssid=None, regex=True
@@ -215,13 +209,18 @@ async def test_receive_re_filter():
         _on_receive_nomatch, r"^VK4[AZ]WI$", ssid=None, regex=True
     )
 
-    # Set a timeout
-    get_event_loop().call_later(1.0, _on_timeout)
-
     # Pass in a message
     my_port.received.emit(frame=bytes(my_frame))
 
-    await receive_future
+    # Receivers are called on the next pass of the event loop
+    await sleep(0)
+
+    assert len(received) == 1, "Receiver not called"
+    kwargs = received.pop(0)
+    assert kwargs.pop("interface") is my_interface, "Wrong interface"
+    assert bytes(kwargs.pop("frame")) == bytes(my_frame), "Wrong frame"
+    assert kwargs.pop("match") is not None, "No match given"
+    assert len(kwargs) == 0, "Too many arguments"
     assert len(unmatched_filter_received) == 0
 
 
@@ -231,45 +230,60 @@ async def test_receive_re_filter_ssid():
     Test matching messages can trigger regex filters (with SSID).
     """
     my_port = DummyKISS()
+    received = []
     unmatched_filter_received = []
     my_frame = AX25UnnumberedInformationFrame(
         destination="VK4BWI-4", source="VK4MSL", pid=0xF0, payload=b"testing"
     )
-    receive_future = Future()
 
     my_interface = AX25Interface(my_port)
 
-    def _on_receive_match(interface, frame, match, **kwargs):
-        try:
-            assert len(kwargs) == 0, "Too many arguments"
-            assert (interface) is (my_interface), "Wrong interface"
-            assert bytes(frame) == bytes(my_frame), "Wrong frame"
-            receive_future.set_result(None)
-        except Exception as e:
-            receive_future.set_exception(e)
+    def _on_receive_match(**kwargs):
+        received.append(kwargs)
 
     def _on_receive_nomatch(**kwargs):
         unmatched_filter_received.append(kwargs)
 
-    def _on_timeout():
-        receive_future.set_exception(AssertionError("Timed out"))
-
     # This should match
     my_interface.bind(_on_receive_match, r"^VK4[BR]WI$", ssid=4, regex=True)
 
     # This should not match
     my_interface.bind(_on_receive_nomatch, r"^VK4[AZ]WI$", ssid=4, regex=True)
 
-    # Set a timeout
-    get_event_loop().call_later(1.0, _on_timeout)
-
     # Pass in a message
     my_port.received.emit(frame=bytes(my_frame))
 
-    await receive_future
+    # Receivers are called on the next pass of the event loop
+    await sleep(0)
+
+    assert len(received) == 1, "Receiver not called"
+    kwargs = received.pop(0)
+    assert kwargs.pop("interface") is my_interface, "Wrong interface"
+    assert bytes(kwargs.pop("frame")) == bytes(my_frame), "Wrong frame"
+    assert kwargs.pop("match") is not None, "No match given"
+    assert len(kwargs) == 0, "Too many arguments"
     assert len(unmatched_filter_received) == 0
 
 
+def test_bind_re_shared():
+    """
+    Test binding the same regex twice shares the compiled pattern.
+    """
+    my_port = DummyKISS()
+    my_interface = AX25Interface(my_port)
+
+    receiver1 = lambda **k: None
+    receiver2 = lambda **k: None
+
+    my_interface.bind(receiver1, r"^MY", ssid=1, regex=True)
+    (pattern, _) = my_interface._receiver_re[r"^MY"]
+
+    my_interface.bind(receiver2, r"^MY", ssid=2, regex=True)
+    assert my_interface._receiver_re == {
+        r"^MY": (pattern, {1: [receiver1], 2: [receiver2]})
+    }
+
+
 def test_unbind_notexist_call():
     """
     Test unbinding a receiver for a call that does not exist returns silently.
@@ -392,19 +406,13 @@ async def test_transmit_waits_cts():
         except Exception as e:
             transmit_future.set_exception(e)
 
-    def _on_timeout():
-        transmit_future.set_exception(AssertionError("Timed out"))
-
     # The time before transmission
     time_before = time.monotonic()
 
-    # Set a timeout
-    get_event_loop().call_later(1.0, _on_timeout)
-
     # Send the message
     my_interface.transmit(my_frame, _on_transmit)
 
-    await transmit_future
+    await wait_transmit(transmit_future)
 
     assert len(my_port.sent) == 1
     (send_time, sent_frame) = my_port.sent.pop(0)
@@ -464,19 +472,13 @@ async def test_transmit_sends_immediate_if_cts():
         except Exception as e:
             transmit_future.set_exception(e)
 
-    def _on_timeout():
-        transmit_future.set_exception(AssertionError("Timed out"))
-
     # The time before transmission
     time_before = time.monotonic()
 
-    # Set a timeout
-    get_event_loop().call_later(1.0, _on_timeout)
-
     # Send the message
     my_interface.transmit(my_frame, _on_transmit)
 
-    await transmit_future
+    await wait_transmit(transmit_future)
 
     assert len(my_port.sent) == 1
     (send_time, sent_frame) = my_port.sent.pop(0)
@@ -512,19 +514,13 @@ async def test_transmit_sends_if_not_expired():
         except Exception as e:
             transmit_future.set_exception(e)
 
-    def _on_timeout():
-        transmit_future.set_exception(AssertionError("Timed out"))
-
     # The time before transmission
     time_before = time.monotonic()
 
-    # Set a timeout
-    get_event_loop().call_later(1.0, _on_timeout)
-
     # Send the message
     my_interface.transmit(my_frame, _on_transmit)
 
-    await transmit_future
+    await wait_transmit(transmit_future)
 
     assert len(my_port.sent) == 1
     (send_time, sent_frame) = my_port.sent.pop(0)
@@ -545,23 +541,17 @@ async def test_transmit_drops_expired():
     )
     # This timestamp was a _long_ time ago!  1AM 1st January 1970
     my_frame.deadline = 3600
-    transmit_future = Future()
 
     my_interface = AX25Interface(my_port)
 
     # Override clear to send expiry
     my_interface._cts_expiry = 0
 
-    def _on_timeout():
-        transmit_future.set_result(None)
-
-    # Set a timeout
-    get_event_loop().call_later(1.0, _on_timeout)
-
     # Send the message
     my_interface.transmit(my_frame)
 
-    await transmit_future
+    # Wait a second
+    await sleep(1)
 
     # Nothing should be sent!
     assert len(my_port.sent) == 0
@@ -589,22 +579,16 @@ async def test_transmit_waits_if_cts_reset():
         except Exception as e:
             transmit_future.set_exception(e)
 
-    def _on_timeout():
-        transmit_future.set_exception(AssertionError("Timed out"))
-
     # The time before transmission
     time_before = time.monotonic()
 
-    # Set a timeout
-    get_event_loop().call_later(1.0, _on_timeout)
-
     # Send the message
     my_interface.transmit(my_frame, _on_transmit)
 
     # Whilst that is pending, call reset_cts, this should delay transmission
     my_interface._reset_cts()
 
-    await transmit_future
+    await wait_transmit(transmit_future)
 
     assert len(my_port.sent) == 1
     (send_time, sent_frame) = my_port.sent.pop(0)
@@ -649,20 +633,14 @@ async def test_transmit_handles_failure():
         except Exception as e:
             transmit_future.set_exception(e)
 
-    def _on_timeout():
-        transmit_future.set_exception(AssertionError("Timed out"))
-
     # The time before transmission
     time_before = time.monotonic()
 
-    # Set a timeout
-    get_event_loop().call_later(2.0, _on_timeout)
-
     # Send the messages
     my_interface.transmit(my_frame_1, _on_transmit)  # This will fail
     my_interface.transmit(my_frame_2, _on_transmit)  # This will work
 
-    await transmit_future
+    await wait_transmit(transmit_future, timeout=2.0)
 
     assert len(my_port.sent) == 1
     (send_time, sent_frame) = my_port.sent.pop(0)
@@ -102,3 +102,31 @@ def test_is_connected():
     signal = Signal()
     signal.connect(slot_fn)
     assert signal.is_connected(slot_fn)
+
+
+def test_emit_snapshot():
+    """
+    Test slots changed during emit only take effect on the next emit.
+    """
+    calls = []
+    signal = Signal()
+
+    def _first(**kw):
+        calls.append("first")
+        signal.disconnect(_first)
+        signal.connect(_third)
+
+    def _second(**kw):
+        calls.append("second")
+
+    def _third(**kw):
+        calls.append("third")
+
+    signal.connect(_first)
+    signal.connect(_second)
+
+    signal.emit()
+    assert calls == ["first", "second"]
+
+    signal.emit()
+    assert calls == ["first", "second", "second", "third"]